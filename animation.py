@@ -0,0 +1,71 @@
+import time
+
+SPIN_DURATION = 13.0  # seconds, about as long as the old fixed-step spin
+SPIN_FPS = 40
+SPIN_TURNS = 7  # whole turns before the wheel settles
+
+
+def ease_out_cubic(progress):
+    return 1 - (1 - progress) ** 3
+
+
+class SpinAnimation:
+    """Computes the wheel angle from a monotonic clock instead of counting frames.
+
+    A late event loop only costs frames, never time: each tick reports the
+    angle for the current instant, and the spin always lands on
+    ``final_angle`` once ``duration`` seconds have passed.
+    """
+
+    def __init__(self, final_angle, duration=SPIN_DURATION, fps=SPIN_FPS,
+                 turns=SPIN_TURNS, easing=ease_out_cubic, clock=time.monotonic):
+        if duration <= 0:
+            raise ValueError("Spin duration must be positive.")
+        if fps <= 0:
+            raise ValueError("Frame rate must be positive.")
+        self.final_angle = final_angle
+        self.duration = duration
+        self.frame_interval = 1 / fps
+        self.total_rotation = turns * 360
+        self.easing = easing
+        self.clock = clock
+        self.start_time = None
+        self.frame = -1
+        self.frames_drawn = 0
+        self.frames_dropped = 0
+        self.travelled = 0
+        self.done = False
+
+    def start(self):
+        self.start_time = self.clock()
+        self.frame = -1
+        self.frames_drawn = 0
+        self.frames_dropped = 0
+        self.travelled = 0
+        self.done = False
+
+    def angle_at(self, elapsed):
+        progress = min(max(elapsed / self.duration, 0), 1)
+        travelled = self.total_rotation * self.easing(progress)
+        return (self.final_angle - self.total_rotation + travelled) % 360, travelled
+
+    def tick(self):
+        """Return ``(angle, done)`` for the current time."""
+        elapsed = self.clock() - self.start_time
+        frame = int(elapsed / self.frame_interval)
+        if frame > self.frame + 1:
+            self.frames_dropped += frame - self.frame - 1
+        self.frame = frame
+        self.frames_drawn += 1
+        if elapsed >= self.duration:
+            self.done = True
+            self.travelled = self.total_rotation
+            return self.final_angle, True
+        angle, self.travelled = self.angle_at(elapsed)
+        return angle, False
+
+    def next_delay_ms(self):
+        """Milliseconds until the next frame slot (or the end of the spin)."""
+        next_time = min((self.frame + 1) * self.frame_interval, self.duration)
+        delay = self.start_time + next_time - self.clock()
+        return max(1, int(round(delay * 1000)))
@@ -0,0 +1,303 @@
+"""Headless benchmarks for the game's hot paths.
+
+    python bench.py --out results.json
+    python bench.py --baseline results.json --threshold 1.25
+
+GameApp methods run against a recording fake canvas and a scheduler that
+replaces Tk's ``after`` with a simulated clock, so no display is needed.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from animation import SpinAnimation
+from engine import GameEngine, WheelConfig
+from player_import import parse_text, validate_rows
+from profiling import Profiler
+from rng import TableRandom
+from ui_queue import UpdateQueue
+from wheel_view import WheelRenderer
+
+# (players, segments) pairs; numbers are drawn from 1 to 5 * segments
+SIZES = ((1, 10), (9, 10), (10, 100), (100, 1000), (1000, 10000), (10000, 100000),
+         (100000, 200000))
+BENCHMARKS = ("player_setup", "update_wheel_numbers", "draw_wheel", "animate_wheel", "end_cycle")
+MIN_TIME = 0.2  # seconds of measured runs per case
+MAX_REPEATS = 50
+THRESHOLD = 1.25  # slower than baseline by this factor counts as a regression
+SPIN_SECONDS = 2.0
+
+
+class RecordingCanvas:
+    """Stands in for tkinter.Canvas and counts the calls made to it."""
+
+    def __init__(self):
+        self.items = 0
+        self.calls = {}
+
+    def record(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def create(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_arc = create_text = create_polygon = create
+
+    def itemconfigure(self, item, **options):
+        self.record("itemconfigure")
+
+    def coords(self, item, *coords):
+        self.record("coords")
+
+    def tag_bind(self, item, sequence, func):
+        pass
+
+
+class FakeWidget:
+    def config(self, **options):
+        pass
+
+    def insert(self, index, text):
+        pass
+
+    def delete(self, first, last=None):
+        pass
+
+
+class SilentSound:
+    def play(self, name):
+        pass
+
+
+class ManualScheduler:
+    """Replaces ``root.after``: callbacks run in order on a simulated clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.queue = []
+
+    def clock(self):
+        return self.now
+
+    def after(self, ms, func):
+        self.queue.append((self.now + ms / 1000, func))
+
+    def run(self):
+        while self.queue:
+            self.queue.sort(key=lambda entry: entry[0])
+            due, func = self.queue.pop(0)
+            self.now = max(self.now, due)
+            func()
+
+
+def make_engine(players, segments, seed=0):
+    return GameEngine(
+        rng=TableRandom(seed), wheel=WheelConfig(segments, 1, max(50, 5 * segments))
+    )
+
+
+def player_rows(players):
+    return "\n".join(f"Player {i + 1},{100 + i % 900}" for i in range(players))
+
+
+def seated_engine(players, segments, seed=0):
+    engine = make_engine(players, segments, seed)
+    engine.seat_players(validate_rows(parse_text(player_rows(players))))
+    engine.start_cycle()
+    engine.start_round()
+    while engine.current_player is not None:
+        engine.choose_number(next(iter(engine.available)))
+    return engine
+
+
+def headless_app(engine, canvas, scheduler):
+    """A GameApp whose widgets are fakes, for timing its drawing and animation."""
+    from gui import GameApp
+
+    app = GameApp.__new__(GameApp)
+    app.root = scheduler
+    app.engine = engine
+    app.profiler = Profiler()
+    app.metrics = None
+    app.sound = SilentSound()
+    app.spin_duration = SPIN_SECONDS
+    app.spin_fps = 40
+    app.num_segments = engine.num_segments
+    app.angle_per_segment = 360 / engine.num_segments
+    app.wheel = WheelRenderer(canvas, engine.num_segments, engine.wheel.palette, 150, 150, 100,
+                              house_number=engine.wheel.house_number)
+    app.overlay = None
+    app.ui = UpdateQueue(scheduler)
+    app.results_text = app.spin_button = app.totals_label = FakeWidget()
+    app.end_cycle = lambda: None
+    return app
+
+
+def bench_player_setup(players, segments):
+    text = player_rows(players)
+
+    def run(engine):
+        engine.seat_players(validate_rows(parse_text(text)))
+    return lambda: make_engine(players, segments), run
+
+
+def bench_update_wheel_numbers(players, segments):
+    rows = parse_text(player_rows(players))
+
+    def setup():
+        # A fresh table each run: the engine writes chosen numbers into it.
+        engine = make_engine(players, segments)
+        engine.seat_players(validate_rows(rows))
+        return engine
+
+    def run(engine):
+        engine.update_wheel_numbers()
+    return setup, run
+
+
+def bench_draw_wheel(players, segments):
+    engine = seated_engine(players, segments)
+    app = headless_app(engine, RecordingCanvas(), ManualScheduler())
+    app.draw_wheel(0)
+    angles = iter(range(1, 1 << 30))
+    return lambda: app, lambda app: app.draw_wheel(next(angles) % 360)
+
+
+def bench_animate_wheel(players, segments):
+    def setup():
+        engine = seated_engine(players, segments)
+        scheduler = ManualScheduler()
+        app = headless_app(engine, RecordingCanvas(), scheduler)
+        app.draw_wheel(0)
+        app.winning_number = engine.pick_winning_number()
+        app.spin = SpinAnimation(app.winning_angle(), SPIN_SECONDS, app.spin_fps,
+                                 clock=scheduler.clock)
+        app.spin.start()
+        app.sound_mark = 0
+        app.frame_due = None
+        return app
+
+    def run(app):
+        app.animate_wheel()
+        app.root.run()
+    return setup, run
+
+
+def bench_end_cycle(players, segments):
+    def setup():
+        engine = seated_engine(players, segments)
+        engine.pick_winning_number()
+        engine.resolve_spin()
+        return engine
+
+    def run(engine):
+        engine.end_cycle()
+    return setup, run
+
+
+def measure(setup, run, min_time=MIN_TIME, max_repeats=MAX_REPEATS):
+    """Time ``run(setup())`` until ``min_time`` seconds are measured; setup is untimed."""
+    times = []
+    while not times or (len(times) < max_repeats and sum(times) < min_time):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_suite(benchmarks=BENCHMARKS, sizes=SIZES, min_time=MIN_TIME, progress=None):
+    results = []
+    for name in benchmarks:
+        factory = globals()[f"bench_{name}"]
+        for players, segments in sizes:
+            times = measure(*factory(players, segments), min_time=min_time)
+            result = {
+                "bench": name,
+                "players": players,
+                "segments": segments,
+                "repeats": len(times),
+                "min_s": min(times),
+                "median_s": statistics.median(times),
+            }
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Return (result, baseline min) pairs that got slower than ``threshold``."""
+    previous = {
+        (r["bench"], r["players"], r["segments"]): r["min_s"] for r in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        base = previous.get((result["bench"], result["players"], result["segments"]))
+        if base is not None and result["min_s"] > base * threshold:
+            regressions.append((result, base))
+    return regressions
+
+
+def _sizes(text):
+    sizes = []
+    for pair in text.split(","):
+        players, _, segments = pair.partition("x")
+        sizes.append((int(players), int(segments)))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths headlessly.")
+    parser.add_argument("--bench", action="append", choices=BENCHMARKS,
+                        help="benchmark to run (repeatable, default all)")
+    parser.add_argument("--sizes", type=_sizes, default=SIZES,
+                        help="comma-separated PLAYERSxSEGMENTS pairs, e.g. 10x100,1000x10000")
+    parser.add_argument("--max-players", type=int, help="skip sizes with more players")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME)
+    parser.add_argument("--out", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against results saved with --out")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+    sizes = [
+        (players, segments) for players, segments in args.sizes
+        if players < segments and (args.max_players is None or players <= args.max_players)
+    ]
+
+    def progress(result):
+        print(
+            f"{result['bench']:<22} {result['players']:>7} players {result['segments']:>7} "
+            f"segments  min {result['min_s'] * 1000:10.3f} ms  "
+            f"median {result['median_s'] * 1000:10.3f} ms  x{result['repeats']}",
+            file=sys.stderr,
+        )
+
+    results = run_suite(args.bench or BENCHMARKS, sizes, args.min_time, progress)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.time(),
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for result, base in regressions:
+            print(
+                f"REGRESSION {result['bench']} {result['players']}x{result['segments']}: "
+                f"{result['min_s'] * 1000:.3f} ms vs baseline {base * 1000:.3f} ms",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import json
+import socket
+from collections import deque
+
+from engine import Settlement, WheelConfig
+from players import PlayerTable, SpinHistory
+from server import DEFAULT_HOST, DEFAULT_PORT
+
+EVENT_LIMIT = 1000  # most recent watch events kept between requests
+
+
+class ServerError(ValueError):
+    pass
+
+
+class TableClient:
+    """Blocking line-delimited JSON connection to a TableServer."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.file = sock.makefile("rwb")
+        self.request_ids = 0
+        # Events from watched tables that arrived between replies, oldest dropped first.
+        self.events = deque(maxlen=EVENT_LIMIT)
+
+    @classmethod
+    def connect(cls, address=f"{DEFAULT_HOST}:{DEFAULT_PORT}"):
+        """Connect to ``host:port`` or, for anything containing a slash, a Unix socket."""
+        if "/" in address:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(address)
+        else:
+            host, _, port = address.rpartition(":")
+            sock = socket.create_connection((host or DEFAULT_HOST, int(port)))
+        return cls(sock)
+
+    def request(self, op, **fields):
+        self.request_ids += 1
+        message = {"op": op, "id": self.request_ids, **fields}
+        self.file.write((json.dumps(message) + "\n").encode())
+        self.file.flush()
+        while True:
+            line = self.file.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection.")
+            reply = json.loads(line)
+            if "event" in reply:
+                self.events.append(reply)
+                continue
+            if reply.get("id") != self.request_ids:
+                continue
+            if not reply.get("ok"):
+                raise ServerError(reply.get("error", "request failed"))
+            return reply
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+class RemoteEngine:
+    """Drives a server table through the GameEngine calls GameApp makes.
+
+    Players, picks and results are mirrored locally from the server's
+    replies so the UI can read them as it would a local engine; the server
+    stays the only place numbers are drawn and cycles are settled. The
+    engine never watches its table: it only reads the socket while it waits
+    for a reply, so events would pile up on the server while the UI sits idle.
+    """
+
+    def __init__(self, client, table=None, wheel=None):
+        self.client = client
+        if table is None:
+            reply = client.request("create", wheel=wheel, watch=False)
+        else:
+            try:
+                reply = client.request("state", table=table)
+            except ServerError:
+                reply = client.request("create", table=table, wheel=wheel, watch=False)
+        self.table = reply["table"]
+        state = reply["state"]
+        self.wheel = WheelConfig(**state["wheel"])
+        self.num_segments = self.wheel.segments
+        self.available_listener = None
+        self.tracked_history = SpinHistory()
+        self.apply_totals(state)
+        self.reset()
+
+    def reset(self):
+        self.players = []
+        self.player_table = None
+        self.wheel_numbers = None
+        self.segment_of = {}
+        self.available = {}
+        self.players_by_number = {}
+        self.current_round = 0
+        self.server_round = 0
+        self.current_player_index = 0
+        self.winning_number = None
+        self.record = None  # the server's settlement once the last pick is in
+
+    def apply_totals(self, state):
+        self.cycle_number = state["cycle"]
+        self.house_balance = state["house_balance"]
+        self.house_profits = state["house_profits"]
+
+    @property
+    def house_totals(self):
+        return self.house_profits + self.house_balance
+
+    @property
+    def taken_numbers(self):
+        return self.players_by_number.keys()
+
+    @property
+    def available_numbers(self):
+        return list(self.available)
+
+    @property
+    def current_player(self):
+        if self.current_player_index < len(self.players):
+            return self.players[self.current_player_index]
+        return None
+
+    def seat_players(self, players):
+        self.player_table = players if isinstance(players, PlayerTable) else None
+        self.players = list(players)
+        if self.players:
+            self.players[0].spin_history = self.tracked_history
+
+    def start_cycle(self):
+        reply = self.client.request(
+            "seat", table=self.table,
+            players=[{"name": p.name, "stake": p.stake} for p in self.players],
+        )
+        state = reply["state"]
+        self.apply_totals(state)
+        self.wheel_numbers = state["wheel_numbers"]
+        self.segment_of = {n: i for i, n in enumerate(self.wheel_numbers)}
+        self.available = dict.fromkeys(state["available"])
+        self.players_by_number = {}
+        for p, seat in zip(self.players, state["seated"]):
+            p.chosen_number = seat["number"]
+            if seat["number"]:
+                self.players_by_number.setdefault(seat["number"], []).append(p)
+        self.server_round = state["round"]
+        self.current_round = 0
+        self.current_player_index = state["player_index"]
+
+    def start_round(self):
+        if self.record is not None or self.server_round <= self.current_round:
+            return False
+        self.current_round = self.server_round
+        return True
+
+    def update_wheel_numbers(self):
+        pass
+
+    def choose_number(self, number):
+        player = self.current_player
+        if player is None:
+            raise ValueError("All players have already chosen.")
+        reply = self.client.request("choose", table=self.table, number=number)
+        old = player.chosen_number
+        if old in self.players_by_number:
+            holders = self.players_by_number[old]
+            holders.remove(player)
+            if not holders:
+                del self.players_by_number[old]
+        player.chosen_number = number
+        player.rounds_played += 1
+        self.players_by_number.setdefault(number, []).append(player)
+        for n in reply["taken"]:
+            self.available.pop(n, None)
+            if self.available_listener is not None:
+                self.available_listener(n, False)
+        for n in reply["freed"]:
+            self.available[n] = None
+            if self.available_listener is not None:
+                self.available_listener(n, True)
+        if "settlement" in reply:
+            self.record = reply["settlement"]
+            self.current_player_index = len(self.players)
+        else:
+            self.server_round = reply["round"]
+            self.current_player_index = reply["player_index"]
+        return player
+
+    def pick_winning_number(self):
+        self.winning_number = self.record["winning_number"]
+        return self.winning_number
+
+    @property
+    def winners(self):
+        return self.players_by_number.get(self.winning_number, [])
+
+    def resolve_spin(self):
+        if self.player_table is not None:
+            self.player_table.record_spin(p.index for p in self.winners)
+        else:
+            for p in self.players:
+                p.spin_history.append(p.chosen_number == self.winning_number)
+        return self.winners
+
+    def end_cycle(self):
+        record = self.record
+        settlement = Settlement(record["cycle"], record["winning_number"], record["stake_pool"])
+        settlement.winner_outputs = [tuple(output) for output in record["payouts"]]
+        settlement.deficit = record["deficit"]
+        settlement.house_pool = record["house_pool"]
+        payouts = dict(settlement.winner_outputs)
+        for p in self.winners:
+            p.payout += payouts.get(p.name, 0)
+            p.wins += 1
+        if record["bonus_player"] is not None:
+            settlement.bonus = record["bonus"]
+            settlement.bonus_player = next(
+                (p for p in self.players
+                 if p.name == record["bonus_player"] and p.chosen_number != self.winning_number),
+                None,
+            )
+            if settlement.bonus_player is not None:
+                settlement.bonus_player.payout += settlement.bonus
+        self.house_balance = record["house_balance"]
+        self.house_profits = record["house_profits"]
+        return settlement
+
+    def next_cycle(self):
+        if self.players:
+            self.tracked_history = self.players[0].spin_history
+        self.cycle_number += 1
+        self.reset()
+
+    def close(self):
+        self.client.close()
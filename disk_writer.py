@@ -0,0 +1,78 @@
+import queue
+import threading
+import time
+
+
+class DiskWriter:
+    """One background thread doing the disk writes of many ledgers and session stores.
+
+    An owner queues its own data, then calls ``schedule(owner, delay)``;
+    within ``delay`` seconds the thread calls ``owner.flush()``, which
+    writes whatever the owner has queued by then. Requests for an owner
+    already waiting keep the earlier deadline, so writes queued in the
+    meantime share one flush. A server with hundreds of tables runs this
+    one thread instead of two per table.
+    """
+
+    def __init__(self):
+        self.requests = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def schedule(self, owner, delay=0.0, done=None):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="disk-writer", daemon=True)
+                self.thread.start()
+        self.requests.put((time.monotonic() + delay, owner, done))
+
+    def flush(self, owner):
+        """Write everything ``owner`` has queued and wait until it is done."""
+        done = threading.Event()
+        self.schedule(owner, done=done)
+        done.wait()
+
+    def close(self):
+        """Flush every owner still waiting and stop the thread."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.requests.put((0.0, None, None))
+            thread.join()
+
+    def run(self):
+        due = {}  # owner -> when its queued writes must be flushed
+        waiting = []  # (owner, event) set once the owner has been flushed
+        closing = False
+        while True:
+            timeout = max(0.0, min(due.values()) - time.monotonic()) if due else None
+            if closing:
+                timeout = 0.0
+            try:
+                at, owner, done = self.requests.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if owner is None:
+                    closing = True
+                else:
+                    if owner not in due or at < due[owner]:
+                        due[owner] = at
+                    if done is not None:
+                        waiting.append((owner, done))
+                # Take in everything already queued before writing.
+                continue
+            now = time.monotonic()
+            for owner in [owner for owner, at in due.items() if closing or at <= now]:
+                del due[owner]
+                try:
+                    owner.flush()
+                except Exception as e:
+                    # One owner's failure must not stop the others' writes.
+                    owner.error = e
+            for owner, done in waiting:
+                if owner not in due:
+                    done.set()
+            waiting = [(owner, done) for owner, done in waiting if owner in due]
+            if closing:
+                return
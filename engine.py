@@ -0,0 +1,472 @@
+import random
+import time
+
+from players import Player, PlayerTable, SpinHistory
+from rng import TableRandom
+
+MINIMUM_STAKE = 100  # KSH
+MAXIMUM_STAKE = 999  # KSH
+ROUNDS_PER_CYCLE = 1
+STARTING_BALANCE = 10000  # KSH
+HOUSE_NUMBER = 13
+PAYOUT_FACTOR = 0.2  # share of the stake pool added to the winners' stakes
+BONUS_CHANCE = 0.1
+BONUS_RATE = 0.05  # share of the remaining pool paid as a bonus
+WHEEL_SEGMENTS = 10
+WHEEL_LOW, WHEEL_HIGH = 1, 50  # numbers drawn onto the wheel, inclusive
+WHEEL_PALETTE = ("red", "blue", "black", "green", "purple")
+MAX_WHEEL_NUMBER = 0xFFFFFFFF  # chosen numbers are stored as unsigned 32-bit, 0 meaning none
+DENSE_RANGE = 4096  # ranges up to this size are sampled from an explicit list
+
+
+class WheelConfig:
+    """Segment count, number range and colour palette of a wheel."""
+
+    def __init__(self, segments=WHEEL_SEGMENTS, low=WHEEL_LOW, high=WHEEL_HIGH,
+                 palette=WHEEL_PALETTE, house_number=HOUSE_NUMBER):
+        if segments < 2:
+            raise ValueError("A wheel needs at least 2 segments.")
+        if low < 1 or high > MAX_WHEEL_NUMBER:
+            raise ValueError(f"Wheel numbers must lie within 1-{MAX_WHEEL_NUMBER}.")
+        if high - low + 1 < segments:
+            raise ValueError(f"Numbers {low}-{high} cannot fill {segments} segments.")
+        if not low <= house_number <= high:
+            raise ValueError(f"House number {house_number} is outside {low}-{high}.")
+        self.segments = segments
+        self.low = low
+        self.high = high
+        self.palette = tuple(palette)
+        self.house_number = house_number
+
+    def as_dict(self):
+        return {
+            "segments": self.segments,
+            "low": self.low,
+            "high": self.high,
+            "house_number": self.house_number,
+        }
+
+
+class Settlement:
+    def __init__(self, cycle_number, winning_number, total_stake_pool):
+        self.cycle_number = cycle_number
+        self.winning_number = winning_number
+        self.total_stake_pool = total_stake_pool
+        self.winner_outputs = []  # (name, payout) per winning player
+        self.deficit = 0
+        self.bonus = 0
+        self.bonus_player = None
+        self.house_pool = 0
+
+    @property
+    def total_payout(self):
+        return sum(payout for _, payout in self.winner_outputs) + self.bonus
+
+
+class GameEngine:
+    def __init__(self, house_balance=STARTING_BALANCE, house_profits=0, rng=None,
+                 wheel=None, ledger=None, rounds_per_cycle=ROUNDS_PER_CYCLE,
+                 payout_factor=PAYOUT_FACTOR, bonus_chance=BONUS_CHANCE,
+                 bonus_rate=BONUS_RATE, metrics=None, session=None):
+        self.house_balance = house_balance
+        self.house_profits = house_profits
+        self.rounds_per_cycle = rounds_per_cycle
+        self.payout_factor = payout_factor
+        self.bonus_chance = bonus_chance
+        self.bonus_rate = bonus_rate
+        self.cycle_number = 1
+        self.rng = rng if rng is not None else TableRandom()
+        self.wheel = wheel if wheel is not None else WheelConfig()
+        self.num_segments = self.wheel.segments
+        self.ledger = ledger
+        self.metrics = metrics  # a metrics.GameMetrics, or None
+        self.session = session  # a snapshot.SessionStore, or None
+        if ledger is not None:
+            ledger.apply_to(self)
+        self.players = []
+        self.player_table = None  # the PlayerTable seated, if players came as one
+        self.tracked_player = None
+        self.tracked_history = SpinHistory()
+        self.prior_spins = 0  # tracked player's spins before this cycle
+        self.wheel_numbers = None
+        self.segment_of = {}  # wheel number -> segment index
+        self.available = {}  # numbers still open, as an insertion-ordered set
+        self.available_synced = False
+        # Called as available_listener(number, is_available) whenever a number
+        # is taken or freed after the wheel is built, so views can update the
+        # one affected item instead of re-reading available_numbers.
+        self.available_listener = None
+        self.winner_segment = None
+        # The number drawn for the cycle winner, until the winner picks or
+        # another player takes it; it may still be picked though not offered.
+        self.drawn_number = None
+        self.winning_number = None
+        self.current_round = 0
+        self.current_player_index = 0
+        self.round_picks = []  # numbers picked this cycle, one list per round
+        # Indexes kept up to date as numbers are chosen, so no lookup has to
+        # scan the players: number -> players holding it, and the cycle winner.
+        self.players_by_number = {}
+        self.cycle_winner = None
+        self.restored = None  # the SessionSnapshot this engine resumed from
+        if session is not None:
+            snapshot = session.load()
+            # Never roll back house totals the ledger has already moved past.
+            if snapshot is not None and snapshot.cycle_number + 1 >= self.cycle_number:
+                snapshot.apply_to(self)
+                self.restored = snapshot
+
+    @property
+    def house_totals(self):
+        return self.house_profits + self.house_balance
+
+    @property
+    def taken_numbers(self):
+        return self.players_by_number.keys()
+
+    @property
+    def available_numbers(self):
+        return list(self.available)
+
+    @property
+    def current_player(self):
+        if self.current_player_index < len(self.players):
+            return self.players[self.current_player_index]
+        return None
+
+    def seat_players(self, players):
+        self.player_table = players if isinstance(players, PlayerTable) else None
+        self.players = list(players)
+        self.players_by_number = {}
+        self.cycle_winner = None
+        for p in self.players:
+            if p.chosen_number:
+                self.players_by_number.setdefault(p.chosen_number, []).append(p)
+        if self.players:
+            self.tracked_player = self.players[0]
+            self.tracked_player.spin_history = self.tracked_history
+        self.prior_spins = len(self.tracked_history)
+
+    def start_cycle(self):
+        begin_cycle = getattr(self.rng, "begin_cycle", None)
+        if begin_cycle is not None:
+            begin_cycle(self.cycle_number)
+        self.current_round = 0
+        self.current_player_index = 0
+        self.round_picks = []
+        self.cycle_winner = None
+        if self.players:
+            if len(self.players) == 1:
+                # Single player: win on first spin, lose thereafter
+                player = self.players[0]
+                player.is_cycle_winner = not player.spin_history  # True if first spin
+                if player.is_cycle_winner:
+                    self.cycle_winner = player
+            else:
+                # Multi-player: ensure a winner by picking a random player
+                winner = self.rng.choice(self.players)
+                for p in self.players:
+                    p.is_cycle_winner = False
+                winner.is_cycle_winner = True
+                self.cycle_winner = winner
+        self.update_wheel_numbers()
+
+    def start_round(self):
+        if self.current_round >= self.rounds_per_cycle:
+            return False
+        self.current_round += 1
+        self.current_player_index = 0
+        self.round_picks.append([])
+        return True
+
+    def update_wheel_numbers(self):
+        if self.wheel_numbers is None:
+            wheel = self.wheel
+            numbers = [wheel.house_number]
+            winner = self.cycle_winner
+            if winner is None:
+                if self.players:
+                    winner = self.rng.choice(self.players)
+                    winner.is_cycle_winner = True
+                    self.cycle_winner = winner
+                else:
+                    return
+            winner_number = self.rng.randint(wheel.low, wheel.high)
+            while winner_number in numbers:
+                winner_number = self.rng.randint(wheel.low, wheel.high)
+            numbers.append(winner_number)
+            self.assign_number(winner, winner_number)
+            self.drawn_number = winner_number
+            remaining_slots = self.num_segments - len(numbers)
+            candidates = range(wheel.low, wheel.high + 1)
+            if len(candidates) <= DENSE_RANGE:
+                random_numbers = self.rng.sample(
+                    [n for n in candidates if n not in numbers], remaining_slots
+                )
+            else:
+                # random.sample picks from a large range by index without
+                # building it, so this is O(segments) whatever the range.
+                picks = self.rng.sample(candidates, remaining_slots + len(numbers))
+                random_numbers = [n for n in picks if n not in numbers][:remaining_slots]
+            self.wheel_numbers = numbers + random_numbers
+            self.rng.shuffle(self.wheel_numbers)
+            self.segment_of = {n: i for i, n in enumerate(self.wheel_numbers)}
+            # Until the first pick the whole wheel is offered, the winner's
+            # number included; after that assign_number keeps it current.
+            self.available = dict.fromkeys(self.wheel_numbers)
+            self.available_synced = False
+            self.winner_segment = self.segment_of[winner_number]
+        elif not self.available_synced:
+            taken = self.players_by_number
+            removed = [num for num in taken if num in self.available]
+            self.available = {
+                num: None for num in self.wheel_numbers if num not in taken
+            }
+            self.available_synced = True
+            if self.available_listener is not None:
+                for num in removed:
+                    self.available_listener(num, False)
+
+    def assign_number(self, player, number):
+        old = player.chosen_number
+        if old:
+            holders = self.players_by_number.get(old)
+            if holders is not None:
+                holders.remove(player)
+                if not holders:
+                    del self.players_by_number[old]
+                    if old in self.segment_of:
+                        self.available[old] = None
+                        if self.available_listener is not None:
+                            self.available_listener(old, True)
+        player.chosen_number = number
+        holders = self.players_by_number.get(number)
+        if holders is None:
+            self.players_by_number[number] = [player]
+            if number in self.available:
+                del self.available[number]
+                if self.available_listener is not None:
+                    self.available_listener(number, False)
+        else:
+            holders.append(player)
+
+    def choose_number(self, number):
+        """Record the current player's pick; raises ValueError if it is not available."""
+        player = self.current_player
+        if player is None:
+            raise ValueError("All players have already chosen.")
+        if number not in self.available and number != self.drawn_number:
+            raise ValueError(f"{number} is not available on the wheel.")
+        if number == self.drawn_number or player is self.cycle_winner:
+            self.drawn_number = None
+        self.assign_number(player, number)
+        self.round_picks[-1].append(number)
+        player.rounds_played += 1
+        self.current_player_index += 1
+        self.update_wheel_numbers()
+        return player
+
+    def pick_winning_number(self):
+        if len(self.players) == 1 and self.players[0].spin_history:
+            # Single player, after first spin: ensure they lose by picking a random number not equal to their choice
+            player = self.players[0]
+            available_numbers = [n for n in self.wheel_numbers if n != player.chosen_number]
+            self.winning_number = self.rng.choice(available_numbers)
+        else:
+            # Single player first spin or multi-player: use winner's number
+            self.winning_number = self.cycle_winner.chosen_number
+        return self.winning_number
+
+    @property
+    def winners(self):
+        return self.players_by_number.get(self.winning_number, [])
+
+    def resolve_spin(self):
+        winning_number = self.winning_number
+        if self.player_table is not None:
+            # One bitmap for the table; only the tracked row keeps a SpinHistory.
+            self.player_table.record_spin(p.index for p in self.winners)
+        else:
+            for p in self.players:
+                p.spin_history.append(p.chosen_number == winning_number)
+        if self.metrics is not None:
+            self.metrics.spin()
+        return self.winners
+
+    def end_cycle(self):
+        started = time.perf_counter() if self.metrics is not None else 0
+        total_stake_pool = sum(p.stake for p in self.players)
+        settlement = Settlement(self.cycle_number, self.winning_number, total_stake_pool)
+        winners = self.winners
+        sum_winner_stakes = sum(p.stake for p in winners) if winners else 1
+        total_winner_payout = sum_winner_stakes + self.payout_factor * total_stake_pool
+        for p in winners:
+            payout = total_winner_payout * (p.stake / sum_winner_stakes)
+            p.payout += payout
+            p.wins += 1
+            settlement.winner_outputs.append((p.name, payout))
+
+        if total_winner_payout > total_stake_pool:
+            settlement.deficit = total_winner_payout - total_stake_pool
+            self.house_balance -= settlement.deficit
+        else:
+            remaining_pool = total_stake_pool - total_winner_payout
+            bonus = 0
+            if self.rng.random() < self.bonus_chance:
+                bonus = self.bonus_rate * remaining_pool
+            settlement.house_pool = remaining_pool - bonus
+            self.house_profits += settlement.house_pool
+
+            if bonus > 0 and len(winners) < len(self.players):
+                settlement.bonus_player = self.pick_loser()
+                settlement.bonus_player.payout += bonus
+                settlement.bonus = bonus
+        if self.ledger is not None:
+            self.ledger.record_cycle(self, settlement)
+        if self.metrics is not None:
+            self.metrics.record_cycle(settlement, time.perf_counter() - started)
+        if self.session is not None:
+            self.session.save(self)
+        return settlement
+
+    def pick_loser(self):
+        # Rejection sampling stays O(1) expected while most players lose;
+        # fall back to building the losers list when winners dominate.
+        players = self.players
+        winning_number = self.winning_number
+        if len(self.winners) * 2 <= len(players):
+            while True:
+                p = self.rng.choice(players)
+                if p.chosen_number != winning_number:
+                    return p
+        return self.rng.choice([p for p in players if p.chosen_number != winning_number])
+
+    def next_cycle(self):
+        self.cycle_number += 1
+        self.clear_table()
+
+    def clear_table(self):
+        """Unseat the players and drop the wheel, staying on this cycle."""
+        # tracked_history is the tracked player's spin_history object, so it
+        # already holds this cycle's spins for whoever is seated first next.
+        self.players = []
+        self.player_table = None
+        self.players_by_number = {}
+        self.cycle_winner = None
+        self.tracked_player = None
+        self.wheel_numbers = None
+        self.segment_of = {}
+        self.available = {}
+        self.available_synced = False
+        self.winner_segment = None
+        self.drawn_number = None
+        self.winning_number = None
+
+    def run_cycle(self, players, choose=None):
+        """Play one whole cycle headlessly and return its Settlement.
+
+        ``choose(engine, player)`` returns the number each player picks; by
+        default players pick uniformly from the numbers still available.
+        """
+        if choose is None:
+            choose = random_chooser(random)
+        self.seat_players(players)
+        self.start_cycle()
+        while self.start_round():
+            while self.current_player is not None:
+                self.choose_number(choose(self, self.current_player))
+        self.pick_winning_number()
+        self.resolve_spin()
+        settlement = self.end_cycle()
+        self.next_cycle()
+        return settlement
+
+
+def random_chooser(rng):
+    """A ``choose`` callback for simulated players drawing from ``rng``.
+
+    Players get their own stream so the table's draws stay the same
+    whether numbers are picked by people or by a simulation.
+    """
+    def choose(engine, player):
+        return rng.choice(engine.available_numbers)
+    return choose
+
+
+class SimulationSummary:
+    def __init__(self):
+        self.cycles = 0
+        self.total_stakes = 0
+        self.total_payouts = 0
+        self.total_bonus = 0
+        self.bonuses_paid = 0
+        self.deficit_cycles = 0
+        self.house_balance = 0
+        self.house_profits = 0
+        self.min_house_balance = None
+
+    @property
+    def house_totals(self):
+        return self.house_profits + self.house_balance
+
+    def as_dict(self):
+        return {
+            "cycles": self.cycles,
+            "total_stakes": self.total_stakes,
+            "total_payouts": self.total_payouts,
+            "total_bonus": self.total_bonus,
+            "bonuses_paid": self.bonuses_paid,
+            "deficit_cycles": self.deficit_cycles,
+            "house_balance": self.house_balance,
+            "house_profits": self.house_profits,
+            "house_totals": self.house_totals,
+            "min_house_balance": self.min_house_balance,
+        }
+
+
+def simulate(cycles, players, stakes, engine=None, choose=None, seed=None):
+    """Run ``cycles`` headless cycles and return a SimulationSummary.
+
+    ``players`` is the number of players seated each cycle and ``stakes`` is
+    either one stake for everybody or a sequence with one stake per player.
+    A ``seed`` makes the run repeatable: it seeds the table's stream and the
+    simulated players' picks.
+    """
+    if isinstance(stakes, (int, float)):
+        stakes = [stakes] * players
+    if len(stakes) != players:
+        raise ValueError("stakes must have one entry per player")
+    for stake in stakes:
+        if not MINIMUM_STAKE <= stake <= MAXIMUM_STAKE:
+            raise ValueError(
+                f"Stake must be between KSH {MINIMUM_STAKE} and KSH {MAXIMUM_STAKE}."
+            )
+    if engine is None:
+        engine = GameEngine(rng=TableRandom(seed, log_draws=False))
+    if choose is None:
+        choose = random_chooser(random if seed is None else random.Random(f"players:{seed}"))
+    if not 1 <= players < engine.num_segments:
+        raise ValueError(
+            f"A {engine.num_segments}-segment wheel seats 1 to {engine.num_segments - 1} players."
+        )
+    names = [f"Player {i + 1}" for i in range(players)]
+    summary = SimulationSummary()
+    min_balance = engine.house_balance
+    for _ in range(cycles):
+        settlement = engine.run_cycle(
+            [Player(name, stake) for name, stake in zip(names, stakes)], choose
+        )
+        summary.total_stakes += settlement.total_stake_pool
+        summary.total_payouts += settlement.total_payout
+        if settlement.bonus:
+            summary.total_bonus += settlement.bonus
+            summary.bonuses_paid += 1
+        if settlement.deficit:
+            summary.deficit_cycles += 1
+            if engine.house_balance < min_balance:
+                min_balance = engine.house_balance
+    summary.cycles = cycles
+    summary.house_balance = engine.house_balance
+    summary.house_profits = engine.house_profits
+    summary.min_house_balance = min_balance
+    return summary
@@ -0,0 +1,517 @@
+import argparse
+import os
+import sys
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+from animation import SPIN_DURATION, SPIN_FPS, SpinAnimation
+from disk_writer import DiskWriter
+from engine import HOUSE_NUMBER, WHEEL_HIGH, WHEEL_LOW, WHEEL_SEGMENTS, GameEngine, WheelConfig
+from ledger import Ledger
+from number_picker import NumberPicker
+from player_grid import PlayerGrid
+from player_import import PlayerImportError, load_file, parse_text, validate_rows
+from profiling import Profiler
+from results_view import ResultsView
+from snapshot import SessionStore
+from sound import SoundPlayer
+from ui_queue import UpdateQueue
+from wheel_view import WheelRenderer
+
+SOUND_EVERY_DEGREES = 100  # replay the spin sound every 100 degrees of travel
+OVERLAY_EVERY_FRAMES = 20
+PROFILED_METHODS = ("draw_wheel", "animate_wheel", "prompt_player", "end_cycle")
+PROFILED_ENGINE_METHODS = ("update_wheel_numbers", "end_cycle")
+RESULT_LINES = 50  # per-player win/loss lines written to the log before summarising
+
+class GameApp:
+    def __init__(self, root, engine=None, spin_duration=SPIN_DURATION, spin_fps=SPIN_FPS,
+                 profiler=None, sound=None, metrics=None):
+        self.root = root
+        self.root.title("Spin the Wheel Game")
+        self.engine = engine if engine is not None else GameEngine()
+        self.spin_duration = spin_duration
+        self.spin_fps = spin_fps
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.sound = sound
+        self.metrics = metrics
+        self.ui = UpdateQueue(root)
+        self.profiler.instrument(self, PROFILED_METHODS)
+        self.profiler.instrument(self.engine, PROFILED_ENGINE_METHODS, "engine.")
+
+        self.main_frame = tk.Frame(root)
+        self.main_frame.pack(padx=10, pady=10)
+
+        self.totals_label = tk.Label(
+            self.main_frame,
+            text=f"House Totals: KSH {self.engine.house_totals:.2f}",
+            font=("Arial", 12, "bold"),
+        )
+        self.totals_label.pack(pady=5)
+
+        self.setup_frame = tk.Frame(self.main_frame, borderwidth=2, relief="groove")
+        self.setup_frame.pack(padx=10, pady=10)
+        tk.Label(
+            self.setup_frame, text="Enter Number of Players", font=("Arial", 14, "bold")
+        ).grid(row=0, column=0, columnspan=2, pady=10)
+
+        tk.Label(
+            self.setup_frame, text="Number of Players:", font=("Arial", 12)
+        ).grid(row=1, column=0, padx=5, pady=5, sticky="e")
+        self.num_players_entry = tk.Entry(self.setup_frame, width=10, font=("Arial", 12))
+        self.num_players_entry.grid(row=1, column=1, padx=5, pady=5)
+
+        self.buttons_frame = tk.Frame(self.setup_frame)
+        self.buttons_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        self.set_players_button = tk.Button(
+            self.buttons_frame,
+            text="Set Players",
+            font=("Arial", 12),
+            command=self.set_player_entries,
+        )
+        self.set_players_button.pack(side="left", padx=5)
+        self.load_button = tk.Button(
+            self.buttons_frame,
+            text="Load File...",
+            font=("Arial", 12),
+            command=self.load_players_file,
+        )
+        self.load_button.pack(side="left", padx=5)
+        self.paste_button = tk.Button(
+            self.buttons_frame,
+            text="Paste",
+            font=("Arial", 12),
+            command=self.paste_players,
+        )
+        self.paste_button.pack(side="left", padx=5)
+
+        self.player_grid = PlayerGrid(self.setup_frame)
+
+        self.start_button = tk.Button(
+            self.setup_frame,
+            text="Start Game",
+            font=("Arial", 12),
+            command=self.start_game,
+        )
+
+        self.num_segments = self.engine.num_segments
+        self.angle_per_segment = 360 / self.num_segments
+        self.colors = self.engine.wheel.palette
+        self.radius = 100
+        self.center_x, self.center_y = 150, 150
+        # The game frame, wheel and audio are built on first use, so the
+        # window comes up as soon as the setup form is ready.
+        self.game_frame = None
+        self.results_frame = None
+
+        # After a restart, offer the last cycle's players again.
+        restored = getattr(self.engine, "restored", None)
+        if restored is not None and len(restored.players):
+            self.import_players(restored.rows())
+
+    def build_game_frame(self):
+        if self.game_frame is not None:
+            return
+        if self.sound is None:
+            self.sound = SoundPlayer()
+        self.game_frame = tk.Frame(self.main_frame)
+        self.canvas = tk.Canvas(self.game_frame, width=300, height=300, bg="grey")
+        self.canvas.pack(pady=10)
+
+        self.wheel = WheelRenderer(
+            self.canvas, self.num_segments, self.colors,
+            self.center_x, self.center_y, self.radius,
+            house_number=self.engine.wheel.house_number,
+        )
+        self.wheel.on_click = self.segment_clicked
+        self.engine.available_listener = self.number_changed
+        self.overlay = None
+        if self.profiler.overlay:
+            self.overlay = self.canvas.create_text(
+                5, 5, anchor="nw", text="", font=("Courier", 8), fill="white"
+            )
+
+        self.number_frame = tk.Frame(self.game_frame)
+        self.number_frame.pack()
+        self.picker = NumberPicker(self.number_frame, command=self.spin_wheel)
+        self.picker.pack(side="left", padx=5)
+        self.spin_button = tk.Button(
+            self.number_frame,
+            text="Confirm Choice",
+            font=("Arial", 12),
+            command=self.spin_wheel,
+        )
+        self.spin_button.pack(side="left")
+
+        self.status_label = tk.Label(
+            self.game_frame, text="", font=("Arial", 12), wraplength=400
+        )
+        self.status_label.pack(pady=10)
+
+        self.results_text = tk.Text(
+            self.game_frame, height=10, width=60, font=("Arial", 12)
+        )
+        self.results_text.pack(pady=10)
+        self.results_text.config(state="disabled")
+
+    def set_player_entries(self):
+        try:
+            num_players = int(self.num_players_entry.get().strip())
+            if num_players < 1:
+                messagebox.showerror("Error", "Number of players must be at least 1.")
+                return
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number of players.")
+            return
+
+        self.player_grid.resize(num_players)
+        self.show_player_grid()
+
+    def load_players_file(self):
+        path = filedialog.askopenfilename(
+            title="Load Players",
+            filetypes=[("Player lists", "*.csv *.tsv *.txt *.json"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            rows = load_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Error", f"Could not read {path}: {e}")
+            return
+        except PlayerImportError as e:
+            messagebox.showerror("Error", e.summary())
+            return
+        self.import_players(rows)
+
+    def paste_players(self):
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            messagebox.showerror("Error", "The clipboard is empty.")
+            return
+        try:
+            rows = parse_text(text)
+        except PlayerImportError as e:
+            messagebox.showerror("Error", e.summary())
+            return
+        self.import_players(rows)
+
+    def import_players(self, rows):
+        if not rows:
+            messagebox.showerror("Error", "No players found.")
+            return
+        self.player_grid.set_rows(rows)
+        self.num_players_entry.config(state="normal")
+        self.num_players_entry.delete(0, "end")
+        self.num_players_entry.insert(0, str(len(rows)))
+        self.show_player_grid()
+        try:
+            validate_rows(rows)
+        except PlayerImportError as e:
+            messagebox.showerror("Error", e.summary())
+
+    def show_player_grid(self):
+        self.player_grid.grid(row=3, column=0, columnspan=2)
+        self.start_button.grid(row=4, column=0, columnspan=2, pady=10)
+        self.set_players_button.config(state="disabled")
+        self.num_players_entry.config(state="disabled")
+
+    def start_game(self):
+        try:
+            players = validate_rows(self.player_grid.get_rows())
+        except PlayerImportError as e:
+            messagebox.showerror("Error", e.summary())
+            return
+        if len(players) >= self.num_segments:
+            messagebox.showerror(
+                "Error",
+                f"A {self.num_segments}-segment wheel seats 1 to {self.num_segments - 1} players.",
+            )
+            return
+        self.engine.seat_players(players)
+        self.build_game_frame()
+        self.setup_frame.pack_forget()
+        self.game_frame.pack()
+        self.update_totals()
+        self.start_cycle()
+
+    @property
+    def players(self):
+        return self.engine.players
+
+    @property
+    def wheel_numbers(self):
+        return self.engine.wheel_numbers
+
+    @property
+    def available_numbers(self):
+        return self.engine.available_numbers
+
+    def update_totals(self):
+        self.ui.set(self.totals_label, text=f"House Totals: KSH {self.engine.house_totals:.2f}")
+
+    def start_cycle(self):
+        cycle_number = self.engine.cycle_number
+        self.ui.set(self.status_label, text=f"Cycle {cycle_number} - Select numbers...")
+        self.engine.start_cycle()
+        self.picker.set_numbers(self.engine.available)
+        self.draw_wheel()
+        self.ui.write(self.results_text, f"\nCycle {cycle_number} (Round {cycle_number})\n")
+        self.update_totals()
+        self.play_round()
+
+    def play_round(self):
+        if not self.engine.start_round():
+            self.end_cycle()
+            return
+        self.ui.write(self.results_text, f"\n===== ROUND {self.engine.current_round} =====\n")
+        self.prompt_player()
+
+    def prompt_player(self):
+        player = self.engine.current_player
+        if player is None:
+            self.spin_wheel()
+            return
+        self.ui.set(
+            self.status_label,
+            text=f"{player.name}, Round {self.engine.current_round}: Pick a number from the wheel",
+        )
+        self.picker.clear()
+        self.ui.set(self.spin_button, state="normal")
+
+    def number_changed(self, number, available):
+        # Only the picker row and wheel label for this number change.
+        self.picker.set_available(number, available)
+        segment = self.engine.segment_of.get(number)
+        if segment is not None:
+            self.wheel.set_label(segment, number, not available)
+
+    def segment_clicked(self, segment):
+        if self.engine.current_player is None or self.wheel_numbers is None:
+            return
+        number = self.wheel_numbers[segment]
+        if number in self.engine.available:
+            self.picker.select(number)
+
+    def update_wheel_numbers(self):
+        self.engine.update_wheel_numbers()
+
+    def draw_wheel(self, start_angle=0):
+        self.wheel.update_labels(self.wheel_numbers, self.engine.taken_numbers)
+        self.wheel.rotate(start_angle)
+
+    def spin_wheel(self):
+        player = self.engine.current_player
+        if player is not None:
+            number = self.picker.get()
+            try:
+                if number is None:
+                    raise ValueError("no number picked")
+                self.engine.choose_number(number)
+            except ValueError:
+                messagebox.showerror(
+                    "Error", "Please select a valid number from the wheel."
+                )
+                return
+            self.ui.write(self.results_text, f"{player.name} chose: {player.chosen_number}\n")
+            if self.engine.current_player is not None:
+                self.prompt_player()
+                return
+
+        self.ui.set(self.spin_button, text="Spin Wheel")
+        self.winning_number = self.engine.pick_winning_number()
+        self.spin = SpinAnimation(
+            self.winning_angle(), self.spin_duration, self.spin_fps
+        )
+        self.spin.start()
+        self.sound_mark = 0
+        self.frame_due = None
+        self.animate_wheel()
+
+    def winning_angle(self):
+        winning_index = self.engine.segment_of[self.winning_number]
+        segment_angle = self.angle_per_segment
+        segment_center = winning_index * segment_angle + (segment_angle / 2)
+        return (90 - segment_center + 180) % 360
+
+    def animate_wheel(self):
+        timing = self.profiler.enabled or self.metrics is not None
+        if timing:
+            self.record_frame()
+        angle, done = self.spin.tick()
+        self.wheel.rotate(angle)
+
+        sound_mark = int(self.spin.travelled // SOUND_EVERY_DEGREES)
+        if sound_mark > self.sound_mark:
+            self.sound_mark = sound_mark
+            self.sound.play("spin")
+
+        if not done:
+            delay = self.spin.next_delay_ms()
+            if timing:
+                self.frame_due = (self.profiler.clock(), delay / 1000)
+            self.root.after(delay, self.animate_wheel)
+        else:
+            if self.profiler.enabled:
+                self.profiler.frames_dropped += self.spin.frames_dropped
+            self.sound.play("win")
+            winners = self.engine.resolve_spin()
+            lines = [f"Winning number: {self.winning_number}\n"]
+            lines.extend(f"{p.name}: 🎉 You WON!\n" for p in winners[:RESULT_LINES])
+            if len(winners) > RESULT_LINES:
+                lines.append(f"...and {len(winners) - RESULT_LINES} more winners.\n")
+            losers = len(self.players) - len(winners)
+            shown = 0
+            for p in self.players:
+                if shown == RESULT_LINES:
+                    lines.append(f"...and {losers - shown} more players: No win.\n")
+                    break
+                if p.chosen_number != self.winning_number:
+                    lines.append(f"{p.name}: No win.\n")
+                    shown += 1
+            self.ui.write(self.results_text, "".join(lines))
+            self.ui.set(self.spin_button, state="disabled")
+            self.update_totals()
+            self.root.after(1000, self.end_cycle)
+
+    def record_frame(self):
+        if self.frame_due is not None:
+            scheduled_at, delay = self.frame_due
+            actual = self.profiler.clock() - scheduled_at
+            if self.profiler.enabled:
+                self.profiler.frame(delay, actual)
+            if self.metrics is not None:
+                self.metrics.frame(actual)
+        if self.overlay is not None and self.profiler.frames % OVERLAY_EVERY_FRAMES == 0:
+            self.canvas.itemconfigure(self.overlay, text=self.profiler.summary_text())
+
+    def end_cycle(self):
+        settlement = self.engine.end_cycle()
+
+        lines = ["\n===== PAYOUTS =====\n"]
+        lines.extend(
+            f"{name}: KSH {payout:.2f}\n" for name, payout in settlement.winner_outputs[:RESULT_LINES]
+        )
+        if len(settlement.winner_outputs) > RESULT_LINES:
+            lines.append(f"...and {len(settlement.winner_outputs) - RESULT_LINES} more payouts.\n")
+        if settlement.bonus_player:
+            lines.append(f"{settlement.bonus_player.name}: KSH {settlement.bonus:.2f} (Bonus)\n")
+        lines.append(f"House Pool: KSH {settlement.house_pool:.2f}\n")
+        lines.append(f"House Totals: KSH {self.engine.house_totals:.2f}\n")
+        self.ui.write(self.results_text, "".join(lines))
+
+        self.build_results_frame()
+        self.results_view.show(self.players)
+        self.ui.set(
+            self.profits_label, text=f"Total House Profits: KSH {self.engine.house_profits:.2f}"
+        )
+        self.ui.set(self.balance_label, text=f"House Balance: KSH {self.engine.house_balance:.2f}")
+        self.ui.set(self.final_totals_label, text=f"House Totals: KSH {self.engine.house_totals:.2f}")
+        self.results_frame.pack(pady=10)
+        self.update_totals()
+
+    def build_results_frame(self):
+        if self.results_frame is not None:
+            return
+        self.results_frame = tk.Frame(self.main_frame)
+        tk.Label(
+            self.results_frame, text="===== FINAL RESULTS =====", font=("Arial", 14)
+        ).pack(pady=10)
+        self.results_view = ResultsView(self.results_frame)
+        self.results_view.pack()
+        self.profits_label = tk.Label(self.results_frame, text="", font=("Arial", 12))
+        self.profits_label.pack(pady=5)
+        self.balance_label = tk.Label(self.results_frame, text="", font=("Arial", 12))
+        self.balance_label.pack(pady=5)
+        self.final_totals_label = tk.Label(self.results_frame, text="", font=("Arial", 12))
+        self.final_totals_label.pack(pady=5)
+        tk.Button(
+            self.results_frame,
+            text="Continue Playing",
+            font=("Arial", 12),
+            command=self.reset_game,
+        ).pack(side="left", padx=5, pady=10)
+        tk.Button(
+            self.results_frame, text="Exit", font=("Arial", 12), command=self.root.quit
+        ).pack(side="left", padx=5, pady=10)
+
+    def reset_game(self):
+        self.ui.clear(self.results_text)
+        self.engine.next_cycle()
+        self.results_view.show([])
+        self.results_frame.pack_forget()
+        self.setup_frame.pack()
+        self.game_frame.pack_forget()
+        self.update_totals()
+        self.player_grid.set_rows([])
+        self.player_grid.grid_forget()
+        self.start_button.grid_forget()
+        self.set_players_button.config(state="normal")
+        self.num_players_entry.config(state="normal")
+        self.num_players_entry.delete(0, "end")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play the wheel game in a Tk window.")
+    parser.add_argument(
+        "--server", default=os.environ.get("CHEZA_SERVER"),
+        help="play a table hosted by server.py at host:port or a socket path",
+    )
+    parser.add_argument("--table", default=os.environ.get("CHEZA_TABLE"))
+    parser.add_argument(
+        "--ledger", default=os.environ.get("CHEZA_LEDGER", "cheza_ledger.jsonl"),
+        help="ledger path when playing locally",
+    )
+    parser.add_argument("--segments", type=int, default=WHEEL_SEGMENTS,
+                        help="wheel segments when playing locally")
+    parser.add_argument("--low", type=int, default=WHEEL_LOW, help="lowest wheel number")
+    parser.add_argument("--high", type=int, default=WHEEL_HIGH, help="highest wheel number")
+    parser.add_argument("--house-number", type=int, default=HOUSE_NUMBER)
+    parser.add_argument(
+        "--session", default=os.environ.get("CHEZA_SESSION", "cheza_session.bin"),
+        help="session snapshot saved after every cycle and resumed at startup",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=os.environ.get("CHEZA_METRICS_PORT"),
+        help="serve Prometheus metrics on this localhost port",
+    )
+    args = parser.parse_args(argv)
+    try:
+        wheel = WheelConfig(args.segments, args.low, args.high, house_number=args.house_number)
+    except ValueError as e:
+        parser.error(str(e))
+    metrics = metrics_server = None
+    if args.metrics_port is not None:
+        from metrics import GameMetrics, MetricsServer
+
+        metrics = GameMetrics()
+        metrics_server = MetricsServer(metrics.registry, int(args.metrics_port))
+    root = tk.Tk()
+    if args.server:
+        # The server keeps the ledger for its tables.
+        from client import RemoteEngine, TableClient
+
+        engine = RemoteEngine(TableClient.connect(args.server), args.table)
+        GameApp(root, engine=engine, profiler=Profiler.from_env(), metrics=metrics)
+        root.mainloop()
+        engine.close()
+    else:
+        writer = DiskWriter()
+        ledger = Ledger(args.ledger, writer=writer)
+        session = SessionStore(args.session, writer=writer)
+        engine = GameEngine(wheel=wheel, ledger=ledger, metrics=metrics, session=session)
+        if metrics is not None:
+            metrics.watch(engine)
+        GameApp(root, engine=engine, profiler=Profiler.from_env(), metrics=metrics)
+        root.mainloop()
+        ledger.close()
+        session.close()
+        writer.close()
+    if metrics_server is not None:
+        metrics_server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+import json
+import os
+import queue
+import time
+
+from disk_writer import DiskWriter
+
+COMMIT_INTERVAL = 0.05  # seconds a commit waits for more records to group
+SNAPSHOT_EVERY = 1000  # records between house-total snapshots
+
+
+def _commit(f, lines):
+    if lines:
+        f.write(b"".join(lines))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class LedgerState:
+    def __init__(self, seq=0, cycle_number=0, house_balance=None, house_profits=None,
+                 offset=0):
+        self.seq = seq
+        self.cycle_number = cycle_number
+        self.house_balance = house_balance
+        self.house_profits = house_profits
+        self.offset = offset  # byte offset just past the last record applied
+
+    def apply(self, record):
+        self.seq = record["seq"]
+        self.cycle_number = record["cycle"]
+        self.house_balance = record["house_balance"]
+        self.house_profits = record["house_profits"]
+
+    def as_dict(self):
+        return {
+            "seq": self.seq,
+            "cycle_number": self.cycle_number,
+            "house_balance": self.house_balance,
+            "house_profits": self.house_profits,
+            "offset": self.offset,
+        }
+
+
+def cycle_record(engine, settlement):
+    """One ledger record for a settled cycle, with the house totals after it."""
+    return {
+        "cycle": settlement.cycle_number,
+        "time": time.time(),
+        "seed": getattr(engine.rng, "table_seed", None),
+        "prior_spins": engine.prior_spins,
+        "wheel": engine.wheel.as_dict(),
+        "rounds_per_cycle": engine.rounds_per_cycle,
+        "players": [
+            {"name": p.name, "stake": p.stake, "number": p.chosen_number}
+            for p in engine.players
+        ],
+        "picks": engine.round_picks,
+        "winning_number": settlement.winning_number,
+        "stake_pool": settlement.total_stake_pool,
+        "payouts": settlement.winner_outputs,
+        "bonus": settlement.bonus,
+        "bonus_player": settlement.bonus_player.name if settlement.bonus_player else None,
+        "deficit": settlement.deficit,
+        "house_pool": settlement.house_pool,
+        "house_balance": engine.house_balance,
+        "house_profits": engine.house_profits,
+        "draws": getattr(engine.rng, "draws", None),
+    }
+
+
+class Ledger:
+    """Append-only JSONL log of settled cycles.
+
+    ``append`` queues the record for a DiskWriter, which writes whatever
+    has queued up within ``commit_interval`` with one write and one fsync,
+    so settlement never waits on the disk. Ledgers can share a writer; one
+    is made for a ledger given none. Every ``snapshot_every`` records the
+    ledger also saves the running house totals and the log offset they
+    cover, which lets ``recover`` skip straight to the tail of a long log.
+    """
+
+    def __init__(self, path, commit_interval=COMMIT_INTERVAL, snapshot_every=SNAPSHOT_EVERY,
+                 writer=None):
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.commit_interval = commit_interval
+        self.snapshot_every = snapshot_every
+        self.state = self.recover()
+        self.records = queue.Queue()
+        self.writer = writer if writer is not None else DiskWriter()
+        self.owns_writer = writer is None
+        self.file = None  # opened by the writer on the first flush
+        self.since_snapshot = 0
+        self.error = None
+
+    def recover(self):
+        state = self.load_snapshot()
+        if not os.path.exists(self.path):
+            return state
+        with open(self.path, "rb+") as f:
+            f.seek(state.offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                state.apply(record)
+                state.offset += len(line)
+            # Drop a record torn by a crash mid-write.
+            f.truncate(state.offset)
+        return state
+
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return LedgerState()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < data["offset"]:
+            return LedgerState()
+        return LedgerState(
+            data["seq"], data["cycle_number"], data["house_balance"],
+            data["house_profits"], data["offset"],
+        )
+
+    def apply_to(self, engine):
+        """Carry recovered house totals and cycle count over to ``engine``."""
+        if self.state.house_balance is not None:
+            engine.house_balance = self.state.house_balance
+            engine.house_profits = self.state.house_profits
+            engine.cycle_number = self.state.cycle_number + 1
+
+    def record_cycle(self, engine, settlement):
+        self.append(cycle_record(engine, settlement))
+
+    def append(self, record):
+        if self.error is not None:
+            raise self.error
+        self.records.put(record)
+        self.writer.schedule(self, self.commit_interval)
+
+    def close(self):
+        self.writer.flush(self)
+        if self.owns_writer:
+            self.writer.close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self.error is not None:
+            raise self.error
+
+    def flush(self):
+        """Write every queued record; called on the writer's thread."""
+        try:
+            if self.file is None:
+                self.file = open(self.path, "ab")
+            self.write_records(self.file)
+        except OSError as e:
+            self.error = e
+
+    def write_records(self, f):
+        state = self.state
+        lines = []
+        while True:
+            try:
+                record = self.records.get_nowait()
+            except queue.Empty:
+                break
+            record["seq"] = state.seq + 1
+            line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+            state.apply(record)
+            state.offset += len(line)
+            lines.append(line)
+            self.since_snapshot += 1
+            if self.since_snapshot >= self.snapshot_every:
+                _commit(f, lines)
+                lines = []
+                self.write_snapshot()
+                self.since_snapshot = 0
+        _commit(f, lines)
+
+    def write_snapshot(self):
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state.as_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
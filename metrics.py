@@ -0,0 +1,223 @@
+import bisect
+import collections
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+METRICS_HOST = "127.0.0.1"
+# Bucket upper bounds in seconds
+SETTLEMENT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+FRAME_BUCKETS = (0.005, 0.01, 0.015, 0.02, 0.025, 0.03, 0.04, 0.05, 0.075, 0.1, 0.25, 0.5)
+SPIN_WINDOW = 60.0  # seconds of spins behind the spins-per-minute gauge
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def samples(self):
+        yield self.name, (), self.value
+
+
+class Gauge:
+    """A value that is set, or read from ``func`` at scrape time.
+
+    Per-table gauges keep one callback per label set, added with ``watch``.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, func=None):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+        self.func = func
+        self.children = {}  # label tuple -> callback
+
+    def set(self, value):
+        self.value = value
+
+    def watch(self, labels, func):
+        self.children[tuple(sorted(labels.items()))] = func
+
+    def unwatch(self, labels):
+        self.children.pop(tuple(sorted(labels.items())), None)
+
+    def samples(self):
+        if self.children:
+            for labels, func in list(self.children.items()):
+                yield self.name, labels, func()
+        else:
+            yield self.name, (), self.func() if self.func is not None else self.value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, bounds):
+        self.name = name
+        self.help = help_text
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def samples(self):
+        cumulative = 0
+        for bound, bucket in zip(self.bounds + (float("inf"),), list(self.buckets)):
+            cumulative += bucket
+            yield self.name + "_bucket", (("le", _number(bound)),), cumulative
+        yield self.name + "_sum", (), self.total
+        yield self.name + "_count", (), self.count
+
+
+class Registry:
+    """Named metrics rendered in the Prometheus text format.
+
+    Updates are plain attribute writes from the one thread that owns the
+    game; the scrape thread only reads, so neither side takes a lock and a
+    scrape can at worst see a cycle half-counted.
+    """
+
+    def __init__(self):
+        self.metrics = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text):
+        return self.add(Counter(name, help_text))
+
+    def gauge(self, name, help_text, func=None):
+        return self.add(Gauge(name, help_text, func))
+
+    def histogram(self, name, help_text, bounds):
+        return self.add(Histogram(name, help_text, bounds))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class GameMetrics:
+    """The game's counters, gauges and latency histograms."""
+
+    def __init__(self, registry=None, clock=time.monotonic):
+        self.registry = registry if registry is not None else Registry()
+        self.clock = clock
+        self.spin_times = collections.deque(maxlen=100000)
+        r = self.registry
+        self.cycles = r.counter("cheza_cycles_total", "Cycles settled.")
+        self.spins = r.counter("cheza_spins_total", "Wheel spins resolved.")
+        r.gauge("cheza_spins_per_minute", "Spins resolved in the last minute.", self.spins_per_minute)
+        self.stakes = r.counter("cheza_stakes_ksh_total", "Stakes taken, in KSH.")
+        self.payouts = r.counter("cheza_payouts_ksh_total", "Winner payouts, in KSH.")
+        self.bonuses = r.counter("cheza_bonuses_ksh_total", "Bonuses paid, in KSH.")
+        self.bonuses_paid = r.counter("cheza_bonuses_paid_total", "Bonuses paid.")
+        self.deficits = r.counter("cheza_deficit_cycles_total", "Cycles the house balance covered.")
+        self.house_balance = r.gauge("cheza_house_balance_ksh", "House balance, in KSH.")
+        self.house_profits = r.gauge("cheza_house_profits_ksh", "House profits, in KSH.")
+        self.settlement_seconds = r.histogram(
+            "cheza_settlement_seconds", "Time spent settling a cycle.", SETTLEMENT_BUCKETS
+        )
+        self.frame_seconds = r.histogram(
+            "cheza_frame_interval_seconds", "Time between spin animation frames.", FRAME_BUCKETS
+        )
+
+    def watch(self, engine, **labels):
+        """Report ``engine``'s house totals, labelled e.g. with ``table=...``."""
+        self.house_balance.watch(labels, lambda: engine.house_balance)
+        self.house_profits.watch(labels, lambda: engine.house_profits)
+
+    def unwatch(self, **labels):
+        self.house_balance.unwatch(labels)
+        self.house_profits.unwatch(labels)
+
+    def spin(self):
+        self.spins.inc()
+        self.spin_times.append(self.clock())
+
+    def spins_per_minute(self):
+        cutoff = self.clock() - SPIN_WINDOW
+        times = list(self.spin_times)
+        return len(times) - bisect.bisect_right(times, cutoff)
+
+    def record_cycle(self, settlement, seconds):
+        self.cycles.inc()
+        self.stakes.inc(settlement.total_stake_pool)
+        self.payouts.inc(sum(payout for _, payout in settlement.winner_outputs))
+        if settlement.bonus:
+            self.bonuses.inc(settlement.bonus)
+            self.bonuses_paid.inc()
+        if settlement.deficit:
+            self.deficits.inc()
+        self.settlement_seconds.observe(seconds)
+
+    def frame(self, seconds):
+        self.frame_seconds.observe(seconds)
+
+
+class MetricsServer:
+    """Serves a registry on localhost from a daemon thread."""
+
+    def __init__(self, registry, port, host=METRICS_HOST):
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] not in ("/", "/metrics"):
+                    handler.send_error(404)
+                    return
+                body = registry.render().encode()
+                handler.send_response(200)
+                handler.send_header("Content-Type", CONTENT_TYPE)
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args):
+                pass
+
+        self.httpd = HTTPServer((host, port), Handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,123 @@
+import bisect
+import tkinter as tk
+
+
+class NumberPicker(tk.Frame):
+    """Type-ahead entry over a list of the numbers still open on the wheel.
+
+    The numbers are kept sorted, so taking or freeing one only inserts or
+    deletes that single listbox row; the list is only refiltered when the
+    typed prefix changes.
+    """
+
+    def __init__(self, master, command=None, height=6):
+        super().__init__(master)
+        self.command = command
+        self.numbers = []  # every available number, sorted
+        self.shown = []  # the numbers matching the typed prefix, sorted
+        self.prefix = ""
+        self.query = tk.StringVar()
+        tk.Label(self, text="Pick a number:", font=("Arial", 12)).grid(row=0, column=0, sticky="w")
+        self.entry = tk.Entry(self, width=8, font=("Arial", 12), textvariable=self.query)
+        self.entry.grid(row=0, column=1, padx=5, sticky="w")
+        self.listbox = tk.Listbox(
+            self, height=height, width=8, font=("Arial", 12), exportselection=False
+        )
+        self.listbox.grid(row=1, column=0, columnspan=2, pady=5, sticky="we")
+        self.query.trace_add("write", lambda *_: self.filter())
+        self.entry.bind("<Return>", self.confirm)
+        self.entry.bind("<Down>", self.focus_list)
+        self.listbox.bind("<Double-Button-1>", self.confirm)
+        self.listbox.bind("<Return>", self.confirm)
+
+    def set_numbers(self, numbers):
+        self.numbers = sorted(numbers)
+        self.query.set("")
+        self.filter()
+
+    def matches(self, number):
+        return str(number).startswith(self.prefix)
+
+    def filter(self):
+        self.prefix = self.query.get().strip()
+        self.shown = [n for n in self.numbers if self.matches(n)]
+        self.listbox.delete(0, "end")
+        if self.shown:
+            self.listbox.insert("end", *self.shown)
+        self.highlight()
+
+    def highlight(self):
+        # Preselect the typed number, or the only match, so Return confirms it.
+        if not self.shown:
+            return
+        index = None
+        if self.prefix.isdigit():
+            number = int(self.prefix)
+            position = bisect.bisect_left(self.shown, number)
+            if position < len(self.shown) and self.shown[position] == number:
+                index = position
+        if index is None and len(self.shown) == 1:
+            index = 0
+        self.listbox.selection_clear(0, "end")
+        if index is not None:
+            self.listbox.selection_set(index)
+            self.listbox.see(index)
+
+    def add(self, number):
+        position = bisect.bisect_left(self.numbers, number)
+        if position < len(self.numbers) and self.numbers[position] == number:
+            return
+        self.numbers.insert(position, number)
+        if self.matches(number):
+            position = bisect.bisect_left(self.shown, number)
+            self.shown.insert(position, number)
+            self.listbox.insert(position, number)
+
+    def remove(self, number):
+        position = bisect.bisect_left(self.numbers, number)
+        if position == len(self.numbers) or self.numbers[position] != number:
+            return
+        del self.numbers[position]
+        position = bisect.bisect_left(self.shown, number)
+        if position < len(self.shown) and self.shown[position] == number:
+            del self.shown[position]
+            self.listbox.delete(position)
+
+    def set_available(self, number, available):
+        if available:
+            self.add(number)
+        else:
+            self.remove(number)
+
+    def select(self, number):
+        self.query.set(str(number))
+
+    def clear(self):
+        if self.prefix:
+            self.query.set("")
+        else:
+            self.listbox.selection_clear(0, "end")
+
+    def get(self):
+        """The picked number, or None if nothing valid is selected or typed."""
+        selection = self.listbox.curselection()
+        if selection and selection[0] < len(self.shown):
+            return self.shown[selection[0]]
+        if self.prefix.isdigit():
+            number = int(self.prefix)
+            position = bisect.bisect_left(self.numbers, number)
+            if position < len(self.numbers) and self.numbers[position] == number:
+                return number
+        return None
+
+    def focus_list(self, event=None):
+        if self.shown:
+            self.listbox.focus_set()
+            if not self.listbox.curselection():
+                self.listbox.selection_set(0)
+        return "break"
+
+    def confirm(self, event=None):
+        if self.command is not None:
+            self.command()
+        return "break"
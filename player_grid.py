@@ -0,0 +1,87 @@
+import tkinter as tk
+
+from virtual_list import VISIBLE_ROWS, VirtualList
+
+
+class PlayerGrid(VirtualList):
+    """Scrollable name/stake entry grid that only has widgets for visible rows.
+
+    The player list lives in ``names``/``stakes``; scrolling rebinds the same
+    few rows of widgets to a different slice of it, so building a 500-player
+    table costs no more than a 10-player one.
+    """
+
+    def __init__(self, master, visible_rows=VISIBLE_ROWS):
+        super().__init__(master, visible_rows)
+        self.names = []
+        self.stakes = []
+        self.loading = False
+        tk.Label(
+            self, text="Enter Player Details", font=("Arial", 14, "bold")
+        ).grid(row=0, column=0, columnspan=4, pady=10)
+        self.rows = []
+        for r in range(visible_rows):
+            name_var = tk.StringVar()
+            stake_var = tk.StringVar()
+            widgets = (
+                tk.Label(self, text="", font=("Arial", 12), width=16, anchor="e"),
+                tk.Entry(self, width=15, font=("Arial", 12), textvariable=name_var),
+                tk.Label(self, text="Stake (KSH):", font=("Arial", 12)),
+                tk.Entry(self, width=10, font=("Arial", 12), textvariable=stake_var),
+            )
+            for column, widget in enumerate(widgets):
+                widget.grid(row=r + 1, column=column, padx=5, pady=5,
+                            sticky="e" if column in (0, 2) else "")
+                self.bind_wheel(widget)
+            name_var.trace_add("write", lambda *_, r=r: self.store(r))
+            stake_var.trace_add("write", lambda *_, r=r: self.store(r))
+            self.rows.append((widgets, name_var, stake_var))
+        self.place_scrollbar(1, 4)
+
+    def set_rows(self, rows):
+        """Replace the player list with ``rows`` of (name, stake text)."""
+        self.names = [name for name, _ in rows]
+        self.stakes = [str(stake) for _, stake in rows]
+        self.first = 0
+        self.refresh()
+
+    def resize(self, count):
+        del self.names[count:]
+        del self.stakes[count:]
+        missing = count - len(self.names)
+        self.names.extend([""] * missing)
+        self.stakes.extend([""] * missing)
+        self.first = min(self.first, max(0, count - self.visible_rows))
+        self.refresh()
+
+    def get_rows(self):
+        return [(name.strip(), stake.strip()) for name, stake in zip(self.names, self.stakes)]
+
+    def store(self, r):
+        if self.loading:
+            return
+        index = self.first + r
+        if index < len(self.names):
+            _, name_var, stake_var = self.rows[r]
+            self.names[index] = name_var.get()
+            self.stakes[index] = stake_var.get()
+
+    def row_count(self):
+        return len(self.names)
+
+    def render_rows(self):
+        self.loading = True
+        try:
+            for r, (widgets, name_var, stake_var) in enumerate(self.rows):
+                index = self.first + r
+                if index < len(self.names):
+                    widgets[0].config(text=f"Player {index + 1} Name:")
+                    name_var.set(self.names[index])
+                    stake_var.set(self.stakes[index])
+                    for widget in widgets:
+                        widget.grid()
+                else:
+                    for widget in widgets:
+                        widget.grid_remove()
+        finally:
+            self.loading = False
@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+import math
+
+from engine import MAXIMUM_STAKE, MINIMUM_STAKE
+from players import PlayerTable
+
+NAME_COLUMNS = ("name", "player", "player name")
+STAKE_COLUMNS = ("stake", "stake (ksh)", "amount")
+
+
+class PlayerImportError(ValueError):
+    """Raised with every problem found in a player list, not just the first."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("\n".join(errors))
+
+    def summary(self, limit=15):
+        lines = self.errors[:limit]
+        if len(self.errors) > limit:
+            lines.append(f"...and {len(self.errors) - limit} more problems.")
+        return "\n".join(lines)
+
+
+def parse_text(text):
+    """Split pasted or loaded text into (name, stake text) rows.
+
+    JSON lists of ``{"name": ..., "stake": ...}`` objects or ``[name, stake]``
+    pairs are accepted, as is CSV or tab-separated text with or without a
+    name/stake header row.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return []
+    if stripped[0] in "[{":
+        try:
+            data = json.loads(stripped)
+        except ValueError as e:
+            raise PlayerImportError([f"Invalid JSON: {e}"])
+        if isinstance(data, dict):
+            data = data.get("players", [])
+        rows = []
+        for item in data:
+            if isinstance(item, dict):
+                rows.append((item.get("name", ""), item.get("stake", "")))
+            elif isinstance(item, (list, tuple)) and len(item) == 2:
+                rows.append(tuple(item))
+            else:
+                rows.append(("", ""))
+        return [(str(name).strip(), str(stake).strip()) for name, stake in rows]
+
+    dialect = "excel-tab" if "\t" in stripped.splitlines()[0] else "excel"
+    reader = csv.reader(io.StringIO(stripped), dialect)
+    rows = [row for row in reader if any(cell.strip() for cell in row)]
+    name_column, stake_column = 0, 1
+    if rows:
+        header = [cell.strip().lower() for cell in rows[0]]
+        names = [i for i, cell in enumerate(header) if cell in NAME_COLUMNS]
+        stakes = [i for i, cell in enumerate(header) if cell in STAKE_COLUMNS]
+        if names and stakes:
+            name_column, stake_column = names[0], stakes[0]
+            rows = rows[1:]
+    return [
+        (
+            row[name_column].strip() if len(row) > name_column else "",
+            row[stake_column].strip() if len(row) > stake_column else "",
+        )
+        for row in rows
+    ]
+
+
+def validate_rows(rows, minimum=MINIMUM_STAKE, maximum=MAXIMUM_STAKE):
+    """Check every (name, stake text) row in one pass and build a PlayerTable.
+
+    Raises PlayerImportError listing all bad rows, so a whole sheet can be
+    fixed at once.
+    """
+    errors = []
+    table = PlayerTable()
+    if not rows:
+        errors.append("No players found.")
+    for number, (name, stake_text) in enumerate(rows, 1):
+        if not name or not stake_text:
+            errors.append(f"Row {number}: please enter name and stake.")
+            continue
+        try:
+            stake = float(stake_text)
+        except ValueError:
+            errors.append(f"Row {number} ({name}): invalid stake amount {stake_text!r}.")
+            continue
+        if not math.isfinite(stake):
+            errors.append(f"Row {number} ({name}): invalid stake amount {stake_text!r}.")
+        elif stake < minimum:
+            errors.append(f"Row {number} ({name}): stake must be at least KSH {minimum}.")
+        elif stake > maximum:
+            errors.append(f"Row {number} ({name}): stake cannot exceed KSH {maximum}.")
+        else:
+            table.append(name, stake)
+    if errors:
+        raise PlayerImportError(errors)
+    return table
+
+
+def load_file(path):
+    with open(path, encoding="utf-8-sig") as f:
+        return parse_text(f.read())
@@ -0,0 +1,282 @@
+import sys
+from array import array
+
+
+class SpinHistory:
+    """Win/loss history packed one bit per spin, with a running win count."""
+
+    __slots__ = ("bits", "length", "win_count")
+
+    def __init__(self, spins=()):
+        self.bits = bytearray()
+        self.length = 0
+        self.win_count = 0
+        for won in spins:
+            self.append(won)
+
+    def append(self, won):
+        index = self.length
+        if index & 7 == 0:
+            self.bits.append(0)
+        if won:
+            self.bits[index >> 3] |= 1 << (index & 7)
+            self.win_count += 1
+        self.length = index + 1
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("spin history index out of range")
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def __iter__(self):
+        bits = self.bits
+        for index in range(self.length):
+            yield bool(bits[index >> 3] >> (index & 7) & 1)
+
+    def __eq__(self, other):
+        if isinstance(other, SpinHistory):
+            return self.length == other.length and self.bits == other.bits
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"SpinHistory({list(self)!r})"
+
+    def copy(self):
+        history = SpinHistory()
+        history.bits = bytearray(self.bits)
+        history.length = self.length
+        history.win_count = self.win_count
+        return history
+
+    @property
+    def wins(self):
+        return self.win_count
+
+    @property
+    def losses(self):
+        return self.length - self.win_count
+
+    def current_streak(self):
+        """Length of the run of equal results ending at the latest spin."""
+        if not self.length:
+            return 0
+        last = self[-1]
+        index = self.length - 1
+        streak = 0
+        # Whole bytes of the same result are skipped eight spins at a time.
+        full = 0xFF if last else 0x00
+        while index >= 0:
+            if index & 7 == 7 and self.bits[index >> 3] == full:
+                streak += 8
+                index -= 8
+                continue
+            if self[index] != last:
+                break
+            streak += 1
+            index -= 1
+        return streak
+
+    def longest_streak(self, won=True):
+        longest = run = 0
+        for result in self:
+            run = run + 1 if result == won else 0
+            if run > longest:
+                longest = run
+        return longest
+
+
+def format_player(player):
+    return (
+        f"{player.name} - Stake: KSH {player.stake:.2f}, "
+        f"Payout: KSH {player.payout:.2f}, Wins: {player.wins}"
+    )
+
+
+class Player:
+    __slots__ = (
+        "name", "stake", "payout", "rounds_played", "wins",
+        "is_cycle_winner", "chosen_number", "spin_history",
+    )
+
+    def __init__(self, name, stake):
+        self.name = name
+        self.stake = stake
+        self.payout = 0
+        self.rounds_played = 0
+        self.wins = 0
+        self.is_cycle_winner = False
+        self.chosen_number = None
+        self.spin_history = SpinHistory()  # Track wins (True) and losses (False)
+
+    def __str__(self):
+        return format_player(self)
+
+
+class PlayerTable:
+    """Columnar storage for large tables; rows are read through PlayerRow views.
+
+    Numbers, stakes and counters live in typed arrays. Spin results are one
+    bitmap per spin for the whole table; only rows given a SpinHistory of
+    their own (the engine's tracked player) keep one in ``histories``.
+    """
+
+    def __init__(self, players=()):
+        self.names = []
+        self.stakes = array("d")
+        self.payouts = array("d")
+        self.wins = array("I")
+        self.rounds_played = array("I")
+        self.chosen = array("I")  # 0 means no number chosen
+        self.spins = []  # one bytearray per spin, bit i set if row i won
+        self.histories = {}  # row -> SpinHistory, for rows that keep their own
+        self.cycle_winner = -1
+        for name, stake in players:
+            self.append(name, stake)
+
+    def append(self, name, stake):
+        self.names.append(name)
+        self.stakes.append(stake)
+        self.payouts.append(0)
+        self.wins.append(0)
+        self.rounds_played.append(0)
+        self.chosen.append(0)
+        return len(self.names) - 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("player table index out of range")
+        return PlayerRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield PlayerRow(self, index)
+
+    def record_spin(self, winners):
+        """Record one spin: the rows indexed in ``winners`` won, every other row lost."""
+        bits = bytearray((len(self.names) + 7) >> 3)
+        for index in winners:
+            bits[index >> 3] |= 1 << (index & 7)
+        self.spins.append(bits)
+        for index, history in self.histories.items():
+            history.append(bits[index >> 3] >> (index & 7) & 1)
+
+    def spin_history(self, index):
+        """Row ``index``'s results, read from its own history or the spin bitmaps."""
+        history = self.histories.get(index)
+        if history is None:
+            history = SpinHistory(bits[index >> 3] >> (index & 7) & 1 for bits in self.spins)
+        return history
+
+    @property
+    def total_stake(self):
+        return sum(self.stakes)
+
+    def nbytes(self):
+        """Approximate memory held by the table, names included."""
+        size = sum(sys.getsizeof(name) for name in self.names) + sys.getsizeof(self.names)
+        for column in (self.stakes, self.payouts, self.wins, self.rounds_played, self.chosen):
+            size += column.buffer_info()[1] * column.itemsize
+        size += sum(len(bits) for bits in self.spins)
+        for history in self.histories.values():
+            size += sys.getsizeof(history) + sys.getsizeof(history.bits)
+        return size
+
+
+class PlayerRow:
+    """A Player-compatible view of one PlayerTable row."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, PlayerRow)
+            and other.table is self.table
+            and other.index == self.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+    def __str__(self):
+        return format_player(self)
+
+    @property
+    def name(self):
+        return self.table.names[self.index]
+
+    @property
+    def stake(self):
+        return self.table.stakes[self.index]
+
+    @stake.setter
+    def stake(self, value):
+        self.table.stakes[self.index] = value
+
+    @property
+    def payout(self):
+        return self.table.payouts[self.index]
+
+    @payout.setter
+    def payout(self, value):
+        self.table.payouts[self.index] = value
+
+    @property
+    def wins(self):
+        return self.table.wins[self.index]
+
+    @wins.setter
+    def wins(self, value):
+        self.table.wins[self.index] = value
+
+    @property
+    def rounds_played(self):
+        return self.table.rounds_played[self.index]
+
+    @rounds_played.setter
+    def rounds_played(self, value):
+        self.table.rounds_played[self.index] = value
+
+    @property
+    def chosen_number(self):
+        return self.table.chosen[self.index] or None
+
+    @chosen_number.setter
+    def chosen_number(self, value):
+        self.table.chosen[self.index] = value or 0
+
+    @property
+    def is_cycle_winner(self):
+        return self.table.cycle_winner == self.index
+
+    @is_cycle_winner.setter
+    def is_cycle_winner(self, value):
+        if value:
+            self.table.cycle_winner = self.index
+        elif self.table.cycle_winner == self.index:
+            self.table.cycle_winner = -1
+
+    @property
+    def spin_history(self):
+        # Unless the row keeps its own, this is a fresh copy of its results.
+        return self.table.spin_history(self.index)
+
+    @spin_history.setter
+    def spin_history(self, history):
+        self.table.histories[self.index] = history
@@ -0,0 +1,151 @@
+import atexit
+import bisect
+import functools
+import json
+import os
+import time
+
+# Bucket upper bounds in seconds: 1us to ~30s, each 25% wider than the last,
+# so any percentile read back from the buckets is within 25% of the truth.
+BUCKET_BOUNDS = []
+_bound = 1e-6
+while _bound < 30:
+    BUCKET_BOUNDS.append(_bound)
+    _bound *= 1.25
+del _bound
+
+
+class LatencyHistogram:
+    """Fixed log-bucket histogram; recording is one bisect and three adds."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                if index < len(BUCKET_BOUNDS):
+                    return min(BUCKET_BOUNDS[index], self.max)
+                return self.max
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class Profiler:
+    """Per-call latency and frame timing for the game's hot paths.
+
+    A disabled profiler wraps nothing, so the only cost left in the game
+    is an ``enabled`` check per animation frame.
+    """
+
+    def __init__(self, enabled=False, overlay=False, clock=time.perf_counter):
+        self.enabled = enabled
+        self.overlay = enabled and overlay
+        self.clock = clock
+        self.calls = {}
+        self.frame_interval = LatencyHistogram()
+        self.frame_jitter = LatencyHistogram()
+        self.frames = 0
+        self.late_frames = 0
+        self.frames_dropped = 0
+
+    @classmethod
+    def from_env(cls):
+        """Build a profiler from ``CHEZA_PROFILE`` (JSON dump path, enables
+        profiling) and ``CHEZA_PROFILE_OVERLAY`` (any non-empty value)."""
+        path = os.environ.get("CHEZA_PROFILE")
+        profiler = cls(enabled=bool(path), overlay=bool(os.environ.get("CHEZA_PROFILE_OVERLAY")))
+        if path:
+            atexit.register(profiler.dump, path)
+        return profiler
+
+    def histogram(self, name):
+        histogram = self.calls.get(name)
+        if histogram is None:
+            histogram = self.calls[name] = LatencyHistogram()
+        return histogram
+
+    def timed(self, name, func):
+        histogram = self.histogram(name)
+        record = histogram.record
+        clock = self.clock
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+        return wrapper
+
+    def instrument(self, obj, names, prefix=""):
+        """Replace ``obj``'s bound methods ``names`` with timed versions."""
+        if not self.enabled:
+            return
+        for name in names:
+            setattr(obj, name, self.timed(prefix + name, getattr(obj, name)))
+
+    def frame(self, scheduled, actual):
+        """Record one animation frame that was due after ``scheduled``
+        seconds and actually ran after ``actual`` seconds."""
+        self.frames += 1
+        self.frame_interval.record(actual)
+        lateness = actual - scheduled
+        if lateness > 0:
+            self.frame_jitter.record(lateness)
+            if lateness > scheduled:
+                self.late_frames += 1
+
+    def report(self):
+        return {
+            "calls": {name: h.as_dict() for name, h in sorted(self.calls.items())},
+            "frames": {
+                "count": self.frames,
+                "late": self.late_frames,
+                "dropped": self.frames_dropped,
+                "interval": self.frame_interval.as_dict(),
+                "jitter": self.frame_jitter.as_dict(),
+            },
+        }
+
+    def summary_text(self):
+        interval = self.frame_interval
+        jitter = self.frame_jitter
+        lines = [
+            f"frame p50 {interval.percentile(50) * 1000:.1f}ms"
+            f" p99 {interval.percentile(99) * 1000:.1f}ms",
+            f"jitter p99 {jitter.percentile(99) * 1000:.1f}ms"
+            f" dropped {self.frames_dropped}",
+        ]
+        for name, histogram in sorted(self.calls.items()):
+            if histogram.count:
+                lines.append(f"{name} p99 {histogram.percentile(99) * 1000:.2f}ms")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
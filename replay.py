@@ -0,0 +1,131 @@
+import json
+import math
+import sys
+import time
+
+from engine import ROUNDS_PER_CYCLE, GameEngine, Player, WheelConfig
+from players import SpinHistory
+from rng import TableRandom
+
+
+class ReplayReport:
+    def __init__(self):
+        self.cycles = 0
+        self.mismatches = []  # (cycle, field, recorded, replayed)
+        self.seconds = 0.0
+
+    @property
+    def ok(self):
+        return not self.mismatches
+
+
+def _same(recorded, replayed):
+    if isinstance(recorded, float) or isinstance(replayed, float):
+        return math.isclose(recorded, replayed, rel_tol=1e-9, abs_tol=1e-6)
+    if isinstance(recorded, (list, tuple)) and isinstance(replayed, (list, tuple)):
+        return len(recorded) == len(replayed) and all(
+            _same(a, b) for a, b in zip(recorded, replayed)
+        )
+    return recorded == replayed
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.endswith("\n"):
+                yield json.loads(line)
+
+
+def replay_record(record):
+    """Re-run one ledger record headlessly and return the differences."""
+    if record.get("seed") is None:
+        return [(record["cycle"], "seed", None, "unrecorded")]
+    rng = TableRandom(record["seed"])
+    engine = GameEngine(
+        house_balance=record["house_balance"] + record["deficit"],
+        house_profits=record["house_profits"] - record["house_pool"],
+        rng=rng,
+        wheel=WheelConfig(**record["wheel"]) if "wheel" in record else None,
+        rounds_per_cycle=record.get("rounds_per_cycle", ROUNDS_PER_CYCLE),
+    )
+    engine.cycle_number = record["cycle"]
+    engine.tracked_history = SpinHistory([False] * record["prior_spins"])
+    players = [Player(p["name"], p["stake"]) for p in record["players"]]
+    engine.seat_players(players)
+    engine.start_cycle()
+    # Records from before picks were logged hold each player's final number.
+    picks = record.get("picks") or [[p["number"] for p in record["players"]]]
+    try:
+        for numbers in picks:
+            if not engine.start_round():
+                raise ValueError("More rounds recorded than the cycle plays.")
+            for number in numbers:
+                engine.choose_number(number)
+        if engine.start_round():
+            raise ValueError("Fewer rounds recorded than the cycle plays.")
+    except ValueError as e:
+        return [(record["cycle"], "choices", picks, str(e))]
+    engine.pick_winning_number()
+    engine.resolve_spin()
+    settlement = engine.end_cycle()
+    replayed = {
+        "winning_number": settlement.winning_number,
+        "payouts": settlement.winner_outputs,
+        "bonus": settlement.bonus,
+        "bonus_player": settlement.bonus_player.name if settlement.bonus_player else None,
+        "deficit": settlement.deficit,
+        "house_pool": settlement.house_pool,
+        "house_balance": engine.house_balance,
+        "house_profits": engine.house_profits,
+        "draws": rng.draws,
+    }
+    return [
+        (record["cycle"], field, record.get(field), value)
+        for field, value in replayed.items()
+        if not _same(record.get(field), value)
+    ]
+
+
+def replay(path):
+    """Replay every cycle in the ledger at ``path`` and check its payouts.
+
+    House totals are also checked across records, so a cycle missing from
+    the log shows up as a mismatch on the following one.
+    """
+    report = ReplayReport()
+    start = time.perf_counter()
+    previous = None
+    for record in read_records(path):
+        report.cycles += 1
+        report.mismatches.extend(replay_record(record))
+        if previous is not None:
+            opening = (
+                record["house_balance"] + record["deficit"],
+                record["house_profits"] - record["house_pool"],
+            )
+            closing = (previous["house_balance"], previous["house_profits"])
+            if not _same(list(opening), list(closing)):
+                report.mismatches.append((record["cycle"], "opening_totals", closing, opening))
+        previous = record
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: replay.py LEDGER", file=sys.stderr)
+        return 2
+    report = replay(argv[0])
+    for cycle, field, recorded, replayed in report.mismatches:
+        print(f"cycle {cycle}: {field} recorded {recorded!r}, replayed {replayed!r}")
+    rate = report.cycles / report.seconds if report.seconds else 0
+    print(
+        f"{report.cycles} cycles replayed in {report.seconds:.2f}s "
+        f"({rate:.0f}/s), {len(report.mismatches)} mismatches"
+    )
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
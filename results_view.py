@@ -0,0 +1,41 @@
+import tkinter as tk
+
+from virtual_list import VISIBLE_ROWS, VirtualList
+
+
+class ResultsView(VirtualList):
+    """Scrollable list of end-of-cycle results.
+
+    ``show`` takes the players themselves; a row's text is only formatted
+    when it scrolls into view, so a 100k-player cycle costs the same to
+    display as a 10-player one.
+    """
+
+    def __init__(self, master, visible_rows=VISIBLE_ROWS, format_row=str):
+        super().__init__(master, visible_rows)
+        self.items = []
+        self.format_row = format_row
+        self.labels = []
+        for r in range(visible_rows):
+            label = tk.Label(self, text="", font=("Arial", 12), anchor="w")
+            label.grid(row=r, column=0, sticky="we")
+            self.bind_wheel(label)
+            self.labels.append(label)
+        self.place_scrollbar(0, 1)
+
+    def show(self, items):
+        self.items = items
+        self.first = 0
+        self.refresh()
+
+    def row_count(self):
+        return len(self.items)
+
+    def render_rows(self):
+        for r, label in enumerate(self.labels):
+            index = self.first + r
+            if index < len(self.items):
+                label.config(text=self.format_row(self.items[index]))
+                label.grid()
+            else:
+                label.grid_remove()
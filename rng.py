@@ -0,0 +1,78 @@
+import hashlib
+import json
+import random
+import secrets
+
+DRAW_LOG_ITEMS = 16  # longer sample/shuffle results are logged as a digest
+
+
+def _loggable(value):
+    if isinstance(value, list):
+        if len(value) > DRAW_LOG_ITEMS:
+            # A whole large wheel per draw would dwarf the rest of the record;
+            # the digest still lets replay confirm the draw matched.
+            items = json.dumps([getattr(v, "name", v) for v in value], separators=(",", ":"))
+            return {"items": len(value), "sha256": hashlib.sha256(items.encode()).hexdigest()[:16]}
+        return [getattr(v, "name", v) for v in value]
+    return getattr(value, "name", value)
+
+
+class TableRandom:
+    """A table's own random stream, reseeded per cycle and logging each draw.
+
+    Cycle ``n`` draws from ``seed_for_cycle(n)``, so any single cycle can be
+    replayed from the table seed alone, and ``draws`` lists what the cycle
+    drew (players by name) for dispute review. Headless simulations that
+    keep no ledger pass ``log_draws=False`` to skip the log.
+
+    The stream is a plain ``random.Random`` wrapped rather than subclassed,
+    so logging never changes how it draws.
+    """
+
+    def __init__(self, seed=None, log_draws=True):
+        self.table_seed = secrets.randbits(64) if seed is None else seed
+        self.log_draws = log_draws
+        self.draws = []
+        self.stream = random.Random(self.table_seed)
+
+    def seed_for_cycle(self, cycle_number):
+        return f"{self.table_seed}:{cycle_number}"
+
+    def begin_cycle(self, cycle_number):
+        self.stream.seed(self.seed_for_cycle(cycle_number))
+        self.draws = []
+
+    def getstate(self):
+        return self.stream.getstate()
+
+    def setstate(self, state):
+        self.stream.setstate(state)
+
+    def choice(self, seq):
+        value = self.stream.choice(seq)
+        if self.log_draws:
+            self.draws.append(["choice", _loggable(value)])
+        return value
+
+    def randint(self, a, b):
+        value = self.stream.randint(a, b)
+        if self.log_draws:
+            self.draws.append(["randint", value])
+        return value
+
+    def sample(self, population, k, **kwargs):
+        value = self.stream.sample(population, k, **kwargs)
+        if self.log_draws:
+            self.draws.append(["sample", _loggable(value)])
+        return value
+
+    def shuffle(self, x):
+        self.stream.shuffle(x)
+        if self.log_draws:
+            self.draws.append(["shuffle", _loggable(x)])
+
+    def random(self):
+        value = self.stream.random()
+        if self.log_draws:
+            self.draws.append(["random", value])
+        return value
@@ -0,0 +1,376 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import re
+import sys
+
+from disk_writer import DiskWriter
+from engine import GameEngine, WheelConfig
+from ledger import Ledger, cycle_record
+from player_import import validate_rows
+from snapshot import SessionStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LINE_LIMIT = 1 << 20  # longest request line accepted, in bytes
+MAX_WRITE_BUFFER = 1 << 20  # watchers further behind than this are dropped
+PRIVATE_FIELDS = ("seed", "draws")  # ledger fields that would let clients predict spins
+SESSION_SUFFIX = ".session"  # per-table snapshot files next to the ledgers
+TABLE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}$")
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+class Table:
+    """One game table: an engine plus the clients watching it.
+
+    A table is plain state driven by requests; it owns no task or timer,
+    so an idle table costs memory but no CPU.
+    """
+
+    def __init__(self, table_id, engine):
+        self.id = table_id
+        self.engine = engine
+        self.watchers = set()
+        self.changes = []  # (number, is_available) since the last request
+        engine.available_listener = self.number_changed
+
+    def number_changed(self, number, available):
+        self.changes.append((number, available))
+
+    @property
+    def phase(self):
+        return "picking" if self.engine.players else "idle"
+
+    def summary(self):
+        engine = self.engine
+        return {
+            "table": self.id,
+            "phase": self.phase,
+            "cycle": engine.cycle_number,
+            "players": len(engine.players),
+            "house_balance": engine.house_balance,
+            "house_profits": engine.house_profits,
+            "wheel": engine.wheel.as_dict(),
+        }
+
+    def turn(self):
+        engine = self.engine
+        player = engine.current_player
+        return {
+            "round": engine.current_round,
+            "player_index": engine.current_player_index,
+            "player": player.name if player is not None else None,
+        }
+
+    def state(self):
+        engine = self.engine
+        state = self.summary()
+        if engine.players:
+            state.update(self.turn())
+            state["wheel_numbers"] = engine.wheel_numbers
+            # The winner's drawn number is offered like any free one, in wheel
+            # order so the order never hints at which number it is.
+            available, hidden = engine.available, engine.drawn_number
+            state["available"] = [
+                n for n in engine.wheel_numbers if n in available or n == hidden
+            ]
+            # The cycle winner holds a number before anyone picks; show only
+            # numbers players have picked, or the seat list names the winner.
+            picked = (
+                len(engine.players) if engine.current_round > 1 else engine.current_player_index
+            )
+            state["seated"] = [
+                {
+                    "name": p.name,
+                    "stake": p.stake,
+                    "number": p.chosen_number if i < picked else None,
+                }
+                for i, p in enumerate(engine.players)
+            ]
+        return state
+
+    def seat(self, players):
+        """Seat ``players`` ({"name", "stake"} objects or [name, stake] pairs)
+        and start a cycle."""
+        engine = self.engine
+        if engine.players:
+            raise ValueError(f"Table {self.id} is already playing cycle {engine.cycle_number}.")
+        rows = [
+            (str(p.get("name", "")), str(p.get("stake", ""))) if isinstance(p, dict)
+            else (str(p[0]), str(p[1]))
+            for p in players
+        ]
+        table = validate_rows(rows)
+        if len(table) >= engine.num_segments:
+            raise ValueError(
+                f"A {engine.num_segments}-segment wheel seats 1 to {engine.num_segments - 1} players."
+            )
+        try:
+            engine.seat_players(table)
+            engine.start_cycle()
+            engine.start_round()
+        except Exception:
+            # Leave the table free to seat again rather than stuck mid-cycle.
+            engine.clear_table()
+            raise
+        finally:
+            self.changes.clear()
+        return self.state()
+
+    def choose(self, number):
+        """Record the current player's pick, settling the cycle after the last one."""
+        engine = self.engine
+        if not engine.players:
+            raise ValueError(f"Table {self.id} has no cycle in progress.")
+        if isinstance(number, bool) or not isinstance(number, int):
+            raise ValueError(f"{number!r} is not a wheel number.")
+        self.changes.clear()
+        hidden = engine.drawn_number
+        player = engine.choose_number(number)
+        result = {"player": player.name, "number": number}
+        if engine.current_player is None and not engine.start_round():
+            result["settlement"] = self.settle()
+        else:
+            result.update(self.turn())
+        # A number can be freed and retaken in one pick; only the net change counts.
+        changes = dict(self.changes)
+        if hidden is not None:
+            if number == hidden:
+                changes[hidden] = False
+            else:
+                # Clients never saw it taken, so neither is it freed for them.
+                changes.pop(hidden, None)
+        result["taken"] = [n for n, available in changes.items() if not available]
+        result["freed"] = [n for n, available in changes.items() if available]
+        self.changes.clear()
+        return result
+
+    def settle(self):
+        engine = self.engine
+        try:
+            engine.pick_winning_number()
+            engine.resolve_spin()
+            settlement = engine.end_cycle()
+            record = cycle_record(engine, settlement)
+        finally:
+            # Every pick is in, so the cycle cannot be retried; free the table.
+            engine.next_cycle()
+        for field in PRIVATE_FIELDS:
+            record.pop(field, None)
+        return record
+
+    def close(self):
+        if self.engine.ledger is not None:
+            self.engine.ledger.close()
+        if self.engine.session is not None:
+            self.engine.session.close()
+
+
+class TableServer:
+    """Hosts any number of tables behind a line-delimited JSON protocol.
+
+    Each request is one JSON object per line with an ``op`` and, for table
+    operations, a ``table`` id; an ``id`` field is echoed back. Replies
+    carry ``"ok": true`` or ``"ok": false`` with an ``error`` message.
+    Clients that ``watch`` a table, or ``create`` it without
+    ``"watch": false``, also receive every change other clients make to it
+    as ``{"event": op, "table": ..., ...}`` lines.
+    """
+
+    def __init__(self, ledger_dir=None, metrics=None):
+        self.tables = {}
+        self.ledger_dir = ledger_dir
+        self.metrics = metrics
+        # Every table's ledger and snapshot writes go through this one thread.
+        self.writer = DiskWriter()
+        self.table_ids = itertools.count(1)
+        self.connections = set()
+
+    def create_table(self, table_id=None, wheel=None):
+        if table_id is None:
+            table_id = f"t{next(self.table_ids)}"
+            while table_id in self.tables:
+                table_id = f"t{next(self.table_ids)}"
+        elif not isinstance(table_id, str) or not TABLE_ID.match(table_id):
+            raise ValueError(f"Invalid table id {table_id!r}.")
+        if table_id in self.tables:
+            raise ValueError(f"Table {table_id} already exists.")
+        ledger = session = None
+        if self.ledger_dir is not None:
+            path = os.path.join(self.ledger_dir, table_id)
+            ledger = Ledger(f"{path}.jsonl", writer=self.writer)
+            session = SessionStore(f"{path}{SESSION_SUFFIX}", writer=self.writer)
+            if wheel is None:
+                snapshot = session.load()
+                if snapshot is not None:
+                    wheel = snapshot.wheel.as_dict()
+        engine = GameEngine(
+            wheel=WheelConfig(**wheel) if wheel else None, ledger=ledger, metrics=self.metrics,
+            session=session,
+        )
+        if self.metrics is not None:
+            self.metrics.watch(engine, table=table_id)
+        table = self.tables[table_id] = Table(table_id, engine)
+        return table
+
+    def table(self, request):
+        table_id = request.get("table")
+        table = self.tables.get(table_id)
+        if table is None:
+            raise ValueError(f"No table {table_id!r}.")
+        return table
+
+    def dispatch(self, request, writer=None):
+        """Handle one request and return its reply (without ``ok``/``id``)."""
+        op = request.get("op")
+        if op == "tables":
+            return {"tables": [table.summary() for table in self.tables.values()]}
+        if op == "create":
+            table = self.create_table(request.get("table"), request.get("wheel"))
+            if writer is not None and request.get("watch", True):
+                table.watchers.add(writer)
+            return {"table": table.id, "state": table.state()}
+        table = self.table(request)
+        if op == "state":
+            return {"table": table.id, "state": table.state()}
+        if op == "watch":
+            if writer is not None:
+                table.watchers.add(writer)
+            return {"table": table.id, "state": table.state()}
+        if op == "unwatch":
+            table.watchers.discard(writer)
+            return {"table": table.id}
+        if op == "seat":
+            reply = {"table": table.id, "state": table.seat(request.get("players") or [])}
+        elif op == "choose":
+            reply = {"table": table.id, **table.choose(request.get("number"))}
+        elif op == "close":
+            del self.tables[table.id]
+            table.close()
+            if self.metrics is not None:
+                self.metrics.unwatch(table=table.id)
+            reply = {"table": table.id}
+        else:
+            raise ValueError(f"Unknown op {op!r}.")
+        self.broadcast(table, {"event": op, **reply}, writer)
+        return reply
+
+    def broadcast(self, table, message, sender=None):
+        if not table.watchers:
+            return
+        line = encode(message)
+        for writer in list(table.watchers):
+            if writer is sender:
+                continue
+            if writer.is_closing():
+                table.watchers.discard(writer)
+                continue
+            writer.write(line)
+            if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                # A watcher that stopped reading must not hold up the table.
+                table.watchers.discard(writer)
+                writer.close()
+
+    async def handle(self, reader, writer):
+        self.connections.add(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Requests must be JSON objects.")
+                    reply = {"ok": True, **self.dispatch(request, writer)}
+                except (ValueError, TypeError, KeyError, IndexError) as e:
+                    reply = {"ok": False, "error": str(e)}
+                except Exception as e:
+                    # A failing ledger or snapshot must not drop the client.
+                    print(f"{request.get('op')!r} failed: {e!r}", file=sys.stderr)
+                    reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                if "id" in request:
+                    reply["id"] = request["id"]
+                writer.write(encode(reply))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(writer)
+            for table in self.tables.values():
+                table.watchers.discard(writer)
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None):
+        if unix is not None:
+            return await asyncio.start_unix_server(self.handle, unix, limit=LINE_LIMIT)
+        return await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+
+    def close(self):
+        for table in self.tables.values():
+            table.close()
+        self.writer.close()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None, ledger_dir=None, tables=0,
+                metrics=None):
+    server = TableServer(ledger_dir, metrics)
+    if ledger_dir is not None:
+        # Reopen the tables that were running before a restart.
+        for name in sorted(os.listdir(ledger_dir)):
+            if name.endswith(SESSION_SUFFIX):
+                server.create_table(name[:-len(SESSION_SUFFIX)])
+    for _ in range(tables):
+        server.create_table()
+    listener = await server.start(host, port, unix)
+    address = unix or f"{host}:{port}"
+    print(f"Serving {len(server.tables)} tables on {address}", file=sys.stderr)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host many game tables in one process.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--ledger-dir",
+                        help="keep a ledger and session snapshot per table in this directory")
+    parser.add_argument("--tables", type=int, default=0, help="tables to open at startup")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve Prometheus metrics on this localhost port")
+    args = parser.parse_args(argv)
+    if args.ledger_dir:
+        os.makedirs(args.ledger_dir, exist_ok=True)
+    metrics = metrics_server = None
+    if args.metrics_port is not None:
+        from metrics import GameMetrics, MetricsServer
+
+        metrics = GameMetrics()
+        metrics_server = MetricsServer(metrics.registry, args.metrics_port)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.ledger_dir, args.tables, metrics))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
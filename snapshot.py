@@ -0,0 +1,333 @@
+import itertools
+import mmap
+import os
+import queue
+import struct
+import sys
+import zlib
+from array import array
+
+from disk_writer import DiskWriter
+from engine import WheelConfig
+from players import PlayerRow, PlayerTable, SpinHistory
+
+MAGIC = b"CHZS"
+VERSION = 2  # 1 kept a history per player; 2 keeps the table's spin bitmaps
+# magic, version, house balance, house profits, cycle number, player count
+HEADER = struct.Struct("<4sH2xddqq")
+WHEEL = struct.Struct("<qqqq")  # segments, low, high, house number
+# table seed length, Random state version, state words, gauss_next (NaN for None)
+RNG = struct.Struct("<IiId")
+HISTORY = struct.Struct("<qq")  # spins, wins
+COUNT = struct.Struct("<q")
+CHECKSUM = struct.Struct("<I")  # crc32 of everything before it
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _pack(code, values):
+    if isinstance(values, array) and values.typecode == code:
+        column = values
+    else:
+        column = array(code, values)
+    if sys.byteorder == "big":
+        column = array(code, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class _Reader:
+    """Walks a snapshot buffer without copying it into a bytes object first."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.offset = 0
+
+    def take(self, size):
+        end = self.offset + size
+        if end > len(self.buffer):
+            raise SnapshotError("Snapshot is truncated.")
+        view = self.buffer[self.offset:end]
+        self.offset = end
+        return view
+
+    def unpack(self, layout):
+        return layout.unpack(self.take(layout.size))
+
+    def array(self, code, count):
+        column = array(code)
+        column.frombytes(self.take(count * column.itemsize))
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
+
+
+class SessionSnapshot:
+    """Everything a table needs to carry on after a restart.
+
+    ``cycle_number`` is the last settled cycle; ``players`` is that cycle's
+    table, a PlayerTable once read back. A captured snapshot shares the
+    seated players with the engine, which never touches them again after
+    ``next_cycle``; only the tracked history lives on, so that is copied.
+    """
+
+    def __init__(self, house_balance, house_profits, cycle_number, wheel, table_seed,
+                 rng_state, tracked_history, players):
+        self.house_balance = house_balance
+        self.house_profits = house_profits
+        self.cycle_number = cycle_number
+        self.wheel = wheel
+        self.table_seed = table_seed
+        self.rng_state = rng_state
+        self.tracked_history = tracked_history
+        self.players = players
+
+    @classmethod
+    def capture(cls, engine):
+        return cls(
+            engine.house_balance, engine.house_profits, engine.cycle_number, engine.wheel,
+            getattr(engine.rng, "table_seed", None), engine.rng.getstate(),
+            engine.tracked_history.copy(), engine.players,
+        )
+
+    def apply_to(self, engine):
+        """Resume ``engine`` at the cycle after the snapshot's."""
+        engine.house_balance = self.house_balance
+        engine.house_profits = self.house_profits
+        engine.cycle_number = self.cycle_number + 1
+        engine.tracked_history = self.tracked_history
+        if self.table_seed is not None and hasattr(engine.rng, "table_seed"):
+            engine.rng.table_seed = self.table_seed
+        engine.rng.setstate(self.rng_state)
+
+    def rows(self):
+        """The players as (name, stake text) rows for the setup grid."""
+        return [(name, f"{stake:g}") for name, stake in zip(self.players.names, self.players.stakes)]
+
+    def to_bytes(self):
+        wheel = self.wheel
+        seed = b"" if self.table_seed is None else str(self.table_seed).encode()
+        version, words, gauss_next = self.rng_state
+        history = self.tracked_history
+        names, stakes, payouts, wins, rounds_played, chosen, spins = _columns(self.players)
+        encoded = [name.encode() for name in names]
+        ends = array("q")
+        end = 0
+        for name in encoded:
+            end += len(name)
+            ends.append(end)
+        parts = [
+            HEADER.pack(MAGIC, VERSION, self.house_balance, self.house_profits,
+                        self.cycle_number, len(names)),
+            WHEEL.pack(wheel.segments, wheel.low, wheel.high, wheel.house_number),
+            RNG.pack(len(seed), version, len(words),
+                     float("nan") if gauss_next is None else gauss_next),
+            seed,
+            _pack("I", words),
+            HISTORY.pack(len(history), history.win_count),
+            bytes(history.bits),
+            _pack("q", ends),
+            b"".join(encoded),
+            _pack("d", stakes),
+            _pack("d", payouts),
+            _pack("I", wins),
+            _pack("I", rounds_played),
+            _pack("I", chosen),
+            # The first player's own history is the tracked one written above.
+            COUNT.pack(len(spins)),
+            b"".join(spins),
+        ]
+        data = b"".join(parts)
+        return data + CHECKSUM.pack(zlib.crc32(data))
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        buffer = memoryview(buffer)
+        try:
+            if len(buffer) < HEADER.size + CHECKSUM.size:
+                raise SnapshotError("Snapshot is truncated.")
+            body = buffer[:-CHECKSUM.size]
+            (checksum,) = CHECKSUM.unpack(buffer[-CHECKSUM.size:])
+            if zlib.crc32(body) != checksum:
+                raise SnapshotError("Snapshot checksum does not match.")
+            reader = _Reader(body)
+            magic, version, house_balance, house_profits, cycle_number, count = (
+                reader.unpack(HEADER)
+            )
+            if magic != MAGIC:
+                raise SnapshotError("Not a session snapshot.")
+            if version not in (1, VERSION):
+                raise SnapshotError(f"Unsupported snapshot version {version}.")
+            segments, low, high, house_number = reader.unpack(WHEEL)
+            wheel = WheelConfig(segments, low, high, house_number=house_number)
+            seed_size, state_version, word_count, gauss_next = reader.unpack(RNG)
+            seed = bytes(reader.take(seed_size)).decode() if seed_size else None
+            if seed is not None and seed.lstrip("-").isdigit():
+                seed = int(seed)
+            words = tuple(reader.array("I", word_count))
+            rng_state = (state_version, words, None if gauss_next != gauss_next else gauss_next)
+            length, win_count = reader.unpack(HISTORY)
+            tracked_history = _history(bytes(reader.take((length + 7) // 8)), length, win_count)
+
+            players = PlayerTable()
+            ends = reader.array("q", count)
+            blob = bytes(reader.take(ends[-1] if count else 0))
+            text = blob.decode()
+            # Offsets are in bytes; they index the decoded text directly
+            # unless some name needed more than one byte per character.
+            source = text if len(text) == len(blob) else blob
+            names = [source[start:end] for start, end in zip(itertools.chain((0,), ends), ends)]
+            players.names = names if source is text else [name.decode() for name in names]
+            players.stakes = reader.array("d", count)
+            players.payouts = reader.array("d", count)
+            players.wins = reader.array("I", count)
+            players.rounds_played = reader.array("I", count)
+            players.chosen = reader.array("I", count)
+            if version == 1:
+                _read_histories(reader, players)
+            else:
+                (spin_count,) = reader.unpack(COUNT)
+                size = (count + 7) >> 3
+                bits = bytes(reader.take(spin_count * size))
+                players.spins = [
+                    bytearray(bits[i * size:(i + 1) * size]) for i in range(spin_count)
+                ]
+                if count:
+                    players.histories[0] = tracked_history
+            if reader.offset != len(body):
+                raise SnapshotError("Snapshot has trailing data.")
+        except SnapshotError:
+            raise
+        except (struct.error, ValueError) as e:
+            raise SnapshotError(f"Snapshot is corrupt: {e}") from None
+        return cls(house_balance, house_profits, cycle_number, wheel, seed, rng_state,
+                   tracked_history, players)
+
+
+def _read_histories(reader, players):
+    # Version 1 kept a SpinHistory for every player that had spun.
+    (history_count,) = reader.unpack(COUNT)
+    indices = reader.array("q", history_count)
+    lengths = reader.array("q", history_count)
+    win_counts = reader.array("q", history_count)
+    bits = bytes(reader.take(sum((length + 7) // 8 for length in lengths)))
+    start = 0
+    for index, length, win_count in zip(indices, lengths, win_counts):
+        end = start + (length + 7) // 8
+        players.histories[index] = _history(bits[start:end], length, win_count)
+        start = end
+
+
+def _history(bits, length, win_count):
+    # Skips SpinHistory.__init__; restoring a big table builds one per player.
+    history = SpinHistory.__new__(SpinHistory)
+    history.bits = bytearray(bits)
+    history.length = length
+    history.win_count = win_count
+    return history
+
+
+def _columns(players):
+    """Column data for ``players``, read straight from their PlayerTable when they share one."""
+    if players and isinstance(players[0], PlayerRow):
+        table = players[0].table
+        if len(table) == len(players) and all(
+            p.table is table and p.index == i for i, p in enumerate(players)
+        ):
+            return (table.names, table.stakes, table.payouts, table.wins,
+                    table.rounds_played, table.chosen, table.spins)
+    # Players with their own histories keep only the latest spin as a bitmap.
+    spins = []
+    if players and all(p.spin_history for p in players):
+        bits = bytearray((len(players) + 7) >> 3)
+        for i, p in enumerate(players):
+            if p.spin_history[-1]:
+                bits[i >> 3] |= 1 << (i & 7)
+        spins.append(bits)
+    return (
+        [p.name for p in players], [p.stake for p in players], [p.payout for p in players],
+        [p.wins for p in players], [p.rounds_played for p in players],
+        [p.chosen_number or 0 for p in players], spins,
+    )
+
+
+class SessionStore:
+    """Keeps the latest SessionSnapshot in one file.
+
+    ``save`` only captures the engine's state and queues it for a
+    DiskWriter (shared between stores, or made for a store given none), so
+    settlement never waits on encoding or the disk. A flush writes only the
+    newest snapshot queued, to a temporary file renamed over the old one,
+    so a crash mid-write leaves the previous snapshot intact. ``load`` maps
+    the file and decodes it in place.
+    """
+
+    def __init__(self, path, writer=None):
+        self.path = path
+        self.snapshots = queue.Queue()
+        self.writer = writer if writer is not None else DiskWriter()
+        self.owns_writer = writer is None
+        self.error = None
+
+    def save(self, engine):
+        if self.error is not None:
+            raise self.error
+        self.snapshots.put(SessionSnapshot.capture(engine))
+        self.writer.schedule(self)
+
+    def close(self):
+        """Write any pending snapshot."""
+        self.writer.flush(self)
+        if self.owns_writer:
+            self.writer.close()
+        if self.error is not None:
+            raise self.error
+
+    def flush(self):
+        """Write the newest queued snapshot; called on the writer's thread."""
+        snapshot = None
+        while True:
+            try:
+                snapshot = self.snapshots.get_nowait()
+            except queue.Empty:
+                break
+        if snapshot is not None:
+            try:
+                self.write(snapshot)
+            except (OSError, ValueError, OverflowError, struct.error) as e:
+                self.error = e
+
+    def write(self, snapshot):
+        data = snapshot.to_bytes()
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def load(self):
+        """The stored snapshot, or None when there is none or it is unreadable."""
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        return SessionSnapshot.from_buffer(view)
+                    except SnapshotError:
+                        return None
+                    finally:
+                        view.release()
+        except OSError:
+            return None
+
+    def restore(self, engine):
+        """Apply the stored snapshot to ``engine`` and return it, or None."""
+        snapshot = self.load()
+        if snapshot is not None:
+            snapshot.apply_to(engine)
+        return snapshot
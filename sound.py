@@ -0,0 +1,234 @@
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import wave
+from array import array
+
+SOUND_DIR = os.path.dirname(os.path.abspath(__file__))
+SOUNDS = {"spin": "spin.wav", "win": "s2.wav"}
+CHUNK_FRAMES = 2048  # ~43ms at 48kHz; the mixer's unit of work
+
+
+class Sound:
+    def __init__(self, name, channels, rate, samples, wav_bytes):
+        self.name = name
+        self.channels = channels
+        self.rate = rate
+        self.samples = samples  # interleaved signed 16-bit PCM
+        self.wav_bytes = wav_bytes  # the original file, for winsound
+
+
+def load_wav(name, path):
+    with open(path, "rb") as f:
+        wav_bytes = f.read()
+    with wave.open(path, "rb") as w:
+        if w.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported.")
+        samples = array("h")
+        samples.frombytes(w.readframes(w.getnframes()))
+        if sys.byteorder == "big":
+            samples.byteswap()
+        return Sound(name, w.getnchannels(), w.getframerate(), samples, wav_bytes)
+
+
+class NullSink:
+    """Swallows audio; used headless and when no backend is available."""
+
+    streaming = False
+
+    def open(self, channels, rate):
+        pass
+
+    def started(self, name):
+        pass
+
+    def play(self, sound):
+        pass
+
+    def write(self, pcm):
+        pass
+
+    def close(self):
+        pass
+
+
+class RecordingSink(NullSink):
+    """Keeps every sound started and every chunk mixed, for tests."""
+
+    streaming = True
+
+    def __init__(self):
+        self.played = []
+        self.chunks = []
+        self.format = None
+
+    def open(self, channels, rate):
+        self.format = (channels, rate)
+
+    def started(self, name):
+        self.played.append(name)
+
+    def write(self, pcm):
+        self.chunks.append(pcm)
+
+
+class AplaySink(NullSink):
+    """Streams raw PCM into an ``aplay`` process (ALSA, Linux)."""
+
+    streaming = True
+
+    def __init__(self, command="aplay"):
+        self.command = command
+        self.process = None
+
+    def open(self, channels, rate):
+        self.process = subprocess.Popen(
+            [self.command, "-q", "-t", "raw", "-f", "S16_LE",
+             "-r", str(rate), "-c", str(channels)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def write(self, pcm):
+        try:
+            self.process.stdin.write(pcm)
+        except (BrokenPipeError, OSError, ValueError):
+            pass
+
+    def close(self):
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            self.process.terminate()
+            self.process = None
+
+
+class WinsoundSink(NullSink):
+    """Plays whole sounds from memory; winsound cannot stream or mix."""
+
+    streaming = False
+
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def play(self, sound):
+        self.winsound.PlaySound(sound.wav_bytes, self.winsound.SND_MEMORY)
+
+
+def default_sink():
+    backend = os.environ.get("CHEZA_AUDIO", "")
+    if backend == "null":
+        return NullSink()
+    if sys.platform == "win32":
+        return WinsoundSink()
+    if shutil.which("aplay"):
+        return AplaySink()
+    return NullSink()
+
+
+class SoundPlayer:
+    """Decodes the game sounds once and plays them from a worker thread.
+
+    ``play`` only queues a request, so the Tk loop never waits on audio.
+    Replaying a sound that is still running restarts it, like winsound's
+    SND_ASYNC did.
+    """
+
+    def __init__(self, sink=None, sounds=SOUNDS, sound_dir=SOUND_DIR):
+        self.sink = sink if sink is not None else default_sink()
+        self.sounds = {
+            name: load_wav(name, os.path.join(sound_dir, filename))
+            for name, filename in sounds.items()
+        }
+        formats = {(s.channels, s.rate) for s in self.sounds.values()}
+        if len(formats) > 1:
+            raise ValueError("All sounds must share one channel count and sample rate.")
+        self.channels, self.rate = formats.pop() if formats else (2, 48000)
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="sound", daemon=True)
+        self.thread.start()
+
+    def play(self, name):
+        if name in self.sounds:
+            self.requests.put(name)
+
+    def close(self):
+        self.requests.put(None)
+        self.thread.join(timeout=1)
+
+    def run(self):
+        if self.sink.streaming:
+            self.sink.open(self.channels, self.rate)
+            self.stream()
+        else:
+            self.play_whole()
+        self.sink.close()
+
+    def play_whole(self):
+        while True:
+            name = self.requests.get()
+            # Only the newest request matters once we are free again.
+            while True:
+                try:
+                    name = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                if name is None:
+                    return
+            if name is None:
+                return
+            self.sink.started(name)
+            self.sink.play(self.sounds[name])
+
+    def stream(self):
+        voices = {}  # sound name -> next sample offset
+        chunk = CHUNK_FRAMES * self.channels
+        while True:
+            try:
+                name = self.requests.get(block=not voices)
+            except queue.Empty:
+                name = False
+            while name is not False:
+                if name is None:
+                    return
+                voices[name] = 0
+                self.sink.started(name)
+                try:
+                    name = self.requests.get_nowait()
+                except queue.Empty:
+                    name = False
+            if voices:
+                self.sink.write(self.mix(voices, chunk))
+
+    def mix(self, voices, chunk):
+        parts = []
+        for name in list(voices):
+            offset = voices[name]
+            samples = self.sounds[name].samples
+            parts.append(samples[offset:offset + chunk])
+            if offset + chunk >= len(samples):
+                del voices[name]
+            else:
+                voices[name] = offset + chunk
+        if len(parts) == 1:
+            mixed = parts[0]
+        else:
+            length = max(len(part) for part in parts)
+            mixed = array("h", bytes(2 * length))
+            totals = [0] * length
+            for part in parts:
+                for i, value in enumerate(part):
+                    totals[i] += value
+            for i, value in enumerate(totals):
+                mixed[i] = 32767 if value > 32767 else -32768 if value < -32768 else value
+        if sys.byteorder == "big":
+            mixed = array("h", mixed)
+            mixed.byteswap()
+        return mixed.tobytes()
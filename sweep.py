@@ -0,0 +1,233 @@
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from engine import (
+    BONUS_CHANCE,
+    BONUS_RATE,
+    MAXIMUM_STAKE,
+    MINIMUM_STAKE,
+    PAYOUT_FACTOR,
+    ROUNDS_PER_CYCLE,
+    WHEEL_SEGMENTS,
+    GameEngine,
+    Player,
+    random_chooser,
+)
+from rng import TableRandom
+
+PARAMETERS = (
+    "min_stake", "max_stake", "rounds_per_cycle", "payout_factor",
+    "bonus_chance", "bonus_rate", "players",
+)
+METRICS = (
+    "total_stakes", "total_payouts", "total_bonus", "bonuses_paid",
+    "deficit_cycles", "house_balance", "house_profits", "min_house_balance",
+    "ruin_cycle",
+)
+
+_results = None  # this worker's view of the shared results block
+
+
+def run_house(point, cycles, seed):
+    """Play ``cycles`` cycles for one house at grid ``point``; returns METRICS."""
+    _check_players(point["players"])
+    table_seed = random.Random(f"house:{seed}").getrandbits(64)
+    engine = GameEngine(
+        rng=TableRandom(table_seed, log_draws=False),
+        rounds_per_cycle=point["rounds_per_cycle"],
+        payout_factor=point["payout_factor"],
+        bonus_chance=point["bonus_chance"],
+        bonus_rate=point["bonus_rate"],
+    )
+    players_rng = random.Random(f"players:{seed}")
+    choose = random_chooser(players_rng)
+    names = [f"Player {i + 1}" for i in range(point["players"])]
+    low, high = point["min_stake"], point["max_stake"]
+    total_stakes = total_payouts = total_bonus = 0.0
+    bonuses_paid = deficit_cycles = 0
+    min_balance = engine.house_balance
+    ruin_cycle = -1
+    for cycle in range(cycles):
+        stakes = [players_rng.randint(low, high) for _ in names]
+        settlement = engine.run_cycle(
+            [Player(name, stake) for name, stake in zip(names, stakes)], choose
+        )
+        total_stakes += settlement.total_stake_pool
+        total_payouts += settlement.total_payout
+        if settlement.bonus:
+            total_bonus += settlement.bonus
+            bonuses_paid += 1
+        if settlement.deficit:
+            deficit_cycles += 1
+            if engine.house_balance < min_balance:
+                min_balance = engine.house_balance
+            if ruin_cycle < 0 and engine.house_balance <= 0:
+                ruin_cycle = cycle + 1
+    return (
+        total_stakes, total_payouts, total_bonus, bonuses_paid, deficit_cycles,
+        engine.house_balance, engine.house_profits, min_balance, ruin_cycle,
+    )
+
+
+def _attach(name):
+    global _results
+    memory = shared_memory.SharedMemory(name=name)
+    _results = (memory, memory.buf.cast("d"))
+
+
+def _run_task(task):
+    row, point, cycles, seed = task
+    width = len(METRICS)
+    _results[1][row * width:(row + 1) * width] = array("d", run_house(point, cycles, seed))
+    return row
+
+
+def _check_players(players, segments=WHEEL_SEGMENTS):
+    if not 1 <= players < segments:
+        raise ValueError(f"A {segments}-segment wheel seats 1 to {segments - 1} players.")
+
+
+def build_grid(options):
+    """Every combination of ``options``, skipping points with min stake above max.
+
+    Player counts the wheel cannot seat raise ValueError up front, before
+    any house is sent to the pool.
+    """
+    for players in options["players"]:
+        _check_players(players)
+    grid = []
+    for values in itertools.product(*(options[name] for name in PARAMETERS)):
+        point = dict(zip(PARAMETERS, values))
+        if point["min_stake"] <= point["max_stake"]:
+            grid.append(point)
+    return grid
+
+
+def summarise(point, houses):
+    """Average one grid point's houses into an output row."""
+    row = dict(point)
+    for column, metric in enumerate(METRICS[:-1]):
+        row[metric] = sum(house[column] for house in houses) / len(houses)
+    ruins = [house[-1] for house in houses if house[-1] >= 0]
+    row["ruin_probability"] = len(ruins) / len(houses)
+    row["mean_cycles_to_ruin"] = sum(ruins) / len(ruins) if ruins else None
+    row["house_edge"] = (
+        (row["total_stakes"] - row["total_payouts"]) / row["total_stakes"]
+        if row["total_stakes"] else 0.0
+    )
+    return row
+
+
+def sweep(options, cycles, repeats=1, seed=0, workers=None):
+    """Run every grid point ``repeats`` times across a process pool.
+
+    Each task is one independent house with its own seeded table and player
+    streams. Workers write their METRICS row straight into a shared memory
+    block, so only row numbers travel back through the pool. Returns one
+    row per grid point with the metrics averaged over its houses.
+    """
+    grid = build_grid(options)
+    tasks = [
+        (row, grid[row // repeats], cycles, f"{seed}:{row}")
+        for row in range(len(grid) * repeats)
+    ]
+    width = len(METRICS)
+    memory = shared_memory.SharedMemory(create=True, size=max(1, len(tasks) * width * 8))
+    try:
+        with Pool(workers, initializer=_attach, initargs=(memory.name,)) as pool:
+            for _ in pool.imap_unordered(_run_task, tasks, chunksize=1):
+                pass
+        values = memory.buf.cast("d")
+        try:
+            houses = [values[row * width:(row + 1) * width].tolist() for row in range(len(tasks))]
+        finally:
+            values.release()
+    finally:
+        memory.close()
+        memory.unlink()
+    return [
+        summarise(point, houses[index * repeats:(index + 1) * repeats])
+        for index, point in enumerate(grid)
+    ]
+
+
+def write_table(rows, path):
+    columns = list(rows[0]) if rows else list(PARAMETERS)
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Writing Parquet needs pyarrow; use a .csv path instead.")
+        table = pyarrow.table({column: [row[column] for row in rows] for column in columns})
+        pyarrow.parquet.write_table(table, path)
+        return
+    if path == "-":
+        _write_csv(rows, columns, sys.stdout)
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        _write_csv(rows, columns, f)
+
+
+def _write_csv(rows, columns, f):
+    writer = csv.DictWriter(f, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _numbers(kind):
+    def parse(text):
+        return [kind(value) for value in text.split(",") if value]
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep stake limits, rounds, payout factor and bonus across all cores."
+    )
+    parser.add_argument("--min-stake", type=_numbers(int), default=[MINIMUM_STAKE])
+    parser.add_argument("--max-stake", type=_numbers(int), default=[MAXIMUM_STAKE])
+    parser.add_argument("--rounds", type=_numbers(int), default=[ROUNDS_PER_CYCLE])
+    parser.add_argument("--payout-factor", type=_numbers(float), default=[PAYOUT_FACTOR])
+    parser.add_argument("--bonus-chance", type=_numbers(float), default=[BONUS_CHANCE])
+    parser.add_argument("--bonus-rate", type=_numbers(float), default=[BONUS_RATE])
+    parser.add_argument("--players", type=_numbers(int), default=[2, 5, 9])
+    parser.add_argument("--cycles", type=int, default=10000, help="cycles per house")
+    parser.add_argument("--repeats", type=int, default=1, help="independent houses per point")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="-", help="CSV (or .parquet) path, - for stdout")
+    args = parser.parse_args(argv)
+    options = {
+        "min_stake": args.min_stake,
+        "max_stake": args.max_stake,
+        "rounds_per_cycle": args.rounds,
+        "payout_factor": args.payout_factor,
+        "bonus_chance": args.bonus_chance,
+        "bonus_rate": args.bonus_rate,
+        "players": args.players,
+    }
+    try:
+        build_grid(options)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    rows = sweep(options, args.cycles, args.repeats, args.seed, args.workers)
+    write_table(rows, args.out)
+    print(
+        f"{len(rows)} points x {args.repeats} houses x {args.cycles} cycles "
+        f"in {time.perf_counter() - start:.1f}s on {args.workers} workers",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
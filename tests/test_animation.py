@@ -0,0 +1,67 @@
+import pytest
+
+from animation import SpinAnimation
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(animation, clock, steps):
+    """Tick at each of ``steps`` seconds after the start; returns the last angle."""
+    animation.start()
+    start = clock.now
+    for offset in steps:
+        clock.now = start + offset
+        angle, done = animation.tick()
+        if done:
+            return angle
+    raise AssertionError("spin did not finish")
+
+
+@pytest.mark.parametrize("final_angle", [0, 37.5, 359])
+def test_spin_lands_on_the_final_angle(final_angle):
+    clock = FakeClock()
+    # 32 fps keeps every frame time exact in binary floating point.
+    animation = SpinAnimation(final_angle, duration=2.0, fps=32, clock=clock)
+    assert run(animation, clock, [n / 32 for n in range(65)]) == final_angle
+    assert animation.frames_dropped == 0
+    assert animation.travelled == animation.total_rotation
+
+
+def test_late_ticks_drop_frames_but_not_time():
+    clock = FakeClock()
+    animation = SpinAnimation(90, duration=2.0, fps=32, clock=clock)
+    # A stalled loop: ticks at 0.5 s, 1.5 s and then well past the end.
+    assert run(animation, clock, [0.5, 1.5, 3.0]) == 90
+    assert animation.frames_drawn == 3
+    # Frames 16, 48 and 96 are drawn; slots 0-15, 17-47 and 49-95 are dropped.
+    assert animation.frames_dropped == 16 + 31 + 47
+    assert animation.done
+
+
+def test_angle_moves_forward_and_delay_targets_the_next_frame():
+    clock = FakeClock()
+    animation = SpinAnimation(10, duration=1.0, fps=20, turns=2, clock=clock)
+    animation.start()
+    clock.now += 0.01
+    animation.tick()
+    assert animation.next_delay_ms() == 40
+    travelled = []
+    for _ in range(19):
+        clock.now += 0.05
+        animation.tick()
+        travelled.append(animation.travelled)
+    assert travelled == sorted(travelled)
+    assert animation.angle_at(0) == (10, 0)
+
+
+def test_rejects_non_positive_duration_and_rate():
+    with pytest.raises(ValueError):
+        SpinAnimation(0, duration=0)
+    with pytest.raises(ValueError):
+        SpinAnimation(0, fps=0)
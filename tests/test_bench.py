@@ -0,0 +1,18 @@
+import pytest
+
+import bench
+
+
+@pytest.mark.parametrize("name", bench.BENCHMARKS)
+def test_each_benchmark_runs(name):
+    times = bench.measure(*getattr(bench, f"bench_{name}")(9, 10), min_time=0, max_repeats=2)
+    assert len(times) == 1
+
+
+def test_update_wheel_numbers_starts_from_a_clean_table():
+    setup, run = bench.bench_update_wheel_numbers(9, 10)
+    for _ in range(3):
+        engine = setup()
+        assert engine.players_by_number == {}
+        run(engine)
+        assert engine.wheel_numbers is not None
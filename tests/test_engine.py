@@ -0,0 +1,127 @@
+import pytest
+
+from engine import MAX_WHEEL_NUMBER, GameEngine, Player, WheelConfig
+from player_import import validate_rows
+from rng import TableRandom
+
+
+@pytest.mark.parametrize("low, high", [(0, 9), (-5, 20), (1, MAX_WHEEL_NUMBER + 1), (1, 10 ** 12)])
+def test_wheel_rejects_numbers_players_cannot_hold(low, high):
+    with pytest.raises(ValueError):
+        WheelConfig(10, low, high, house_number=max(low, 5))
+
+
+@pytest.mark.parametrize("low, high", [(1, 10), (MAX_WHEEL_NUMBER - 999, MAX_WHEEL_NUMBER)])
+def test_every_cycle_has_a_winning_number(low, high):
+    for seed in range(50):
+        engine = GameEngine(
+            rng=TableRandom(seed), wheel=WheelConfig(10, low, high, house_number=low + 4)
+        )
+        players = validate_rows([("a", "100"), ("b", "200"), ("c", "300")])
+        settlement = engine.run_cycle(
+            players, choose=lambda engine, player: next(iter(engine.available))
+        )
+        assert low <= settlement.winning_number <= high
+
+
+def first_available(engine, player):
+    return next(iter(engine.available))
+
+
+def play_to_spin(engine, players, choose=first_available):
+    engine.seat_players(players)
+    engine.start_cycle()
+    while engine.start_round():
+        while engine.current_player is not None:
+            engine.choose_number(choose(engine, engine.current_player))
+    engine.pick_winning_number()
+    engine.resolve_spin()
+
+
+def test_winner_gets_stake_plus_a_fifth_of_the_pool():
+    for seed in range(20):
+        engine = GameEngine(rng=TableRandom(seed), bonus_chance=0)
+        players = [Player("a", 100), Player("b", 200), Player("c", 300)]
+        play_to_spin(engine, players)
+        (winner,) = engine.winners
+        assert winner is engine.cycle_winner
+        settlement = engine.end_cycle()
+
+        pool = 600
+        payout = winner.stake + 0.2 * pool
+        assert settlement.total_stake_pool == pool
+        assert settlement.winner_outputs == [(winner.name, pytest.approx(payout))]
+        assert winner.payout == pytest.approx(payout)
+        assert winner.wins == 1
+        assert settlement.house_pool == pytest.approx(pool - payout)
+        assert engine.house_profits == pytest.approx(pool - payout)
+        assert engine.house_balance == 10000
+        assert settlement.deficit == 0
+
+
+def test_deficit_comes_out_of_the_house_balance():
+    deficits = 0
+    for seed in range(20):
+        engine = GameEngine(rng=TableRandom(seed))
+        play_to_spin(engine, [Player("a", 900), Player("b", 100)])
+        winner = engine.cycle_winner
+        settlement = engine.end_cycle()
+        payout = winner.stake + 0.2 * 1000
+        if payout > 1000:
+            assert settlement.deficit == pytest.approx(payout - 1000)
+            assert engine.house_balance == pytest.approx(10000 - (payout - 1000))
+            assert engine.house_profits == 0
+            assert settlement.bonus == 0
+            deficits += 1
+        else:
+            assert engine.house_balance == 10000
+    assert 0 < deficits < 20
+
+
+def test_bonus_goes_to_a_loser():
+    for seed in range(30):
+        engine = GameEngine(rng=TableRandom(seed), bonus_chance=1)
+        players = [Player(name, 100 + 100 * i) for i, name in enumerate("abcd")]
+        play_to_spin(engine, players)
+        winner = engine.cycle_winner
+        settlement = engine.end_cycle()
+        remaining = 1000 - (winner.stake + 0.2 * 1000)
+        assert settlement.bonus == pytest.approx(0.05 * remaining)
+        assert settlement.bonus_player is not None
+        assert settlement.bonus_player is not winner
+        assert settlement.bonus_player.payout == pytest.approx(settlement.bonus)
+        assert settlement.house_pool == pytest.approx(remaining - settlement.bonus)
+
+
+def test_single_player_wins_the_first_spin_only():
+    engine = GameEngine(rng=TableRandom(5))
+    outcomes = []
+    for _ in range(4):
+        player = Player("solo", 500)
+        settlement = engine.run_cycle([player], first_available)
+        outcomes.append(settlement.winning_number == player.chosen_number)
+    assert outcomes == [True, False, False, False]
+    assert list(engine.tracked_history) == outcomes
+
+
+def test_players_may_take_the_winners_drawn_number():
+    for seed in range(20):
+        engine = GameEngine(rng=TableRandom(seed), bonus_chance=0)
+        players = [Player("a", 100), Player("b", 200), Player("c", 300)]
+
+        taken = []
+
+        def take_drawn(engine, player):
+            # The second pick, after the drawn number has left engine.available.
+            if (engine.current_player_index == 1 and player is not engine.cycle_winner
+                    and engine.drawn_number is not None):
+                taken.append(engine.drawn_number)
+                return engine.drawn_number
+            return first_available(engine, player)
+
+        play_to_spin(engine, players, take_drawn)
+        (winner,) = engine.winners
+        assert winner is engine.cycle_winner
+        assert engine.drawn_number is None
+        if taken:
+            assert players[1].chosen_number == taken[0] != winner.chosen_number
@@ -0,0 +1,108 @@
+import json
+import os
+
+from engine import GameEngine, Player
+from ledger import Ledger
+from replay import replay
+from rng import TableRandom
+
+
+def play(path, cycles, seed=7, rounds_per_cycle=1, **ledger_options):
+    ledger = Ledger(str(path), **ledger_options)
+    engine = GameEngine(rng=TableRandom(seed), ledger=ledger, rounds_per_cycle=rounds_per_cycle)
+    for _ in range(cycles):
+        engine.run_cycle([Player("Ann", 150), Player("Ben", 300), Player("Cy", 420)])
+    ledger.close()
+    return engine
+
+
+def test_recover_drops_torn_record(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    engine = play(path, 20)
+    size = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(b'{"cycle":21,"house_bal')
+
+    ledger = Ledger(str(path))
+    assert ledger.state.seq == 20
+    assert ledger.state.cycle_number == 20
+    assert ledger.state.house_balance == engine.house_balance
+    assert ledger.state.house_profits == engine.house_profits
+    assert os.path.getsize(path) == size
+
+    resumed = GameEngine(ledger=ledger)
+    assert resumed.cycle_number == 21
+    assert resumed.house_totals == engine.house_totals
+    report = replay(str(path))
+    assert report.cycles == 20
+    assert report.ok, report.mismatches
+
+
+def test_replay_follows_every_round(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    play(path, 8, rounds_per_cycle=3)
+    with open(path, encoding="utf-8") as f:
+        record = json.loads(f.readline())
+    assert record["rounds_per_cycle"] == 3
+    assert len(record["picks"]) == 3
+    assert record["picks"][-1] == [p["number"] for p in record["players"]]
+    report = replay(str(path))
+    assert report.cycles == 8
+    assert report.ok, report.mismatches
+
+
+def test_recover_from_snapshot_and_tail(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    engine = play(path, 10, commit_interval=0, snapshot_every=4)
+    with open(str(path) + ".snapshot", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot["seq"] == 8
+    assert snapshot["offset"] < os.path.getsize(path)
+
+    state = Ledger(str(path)).state
+    assert state.seq == 10
+    assert state.house_balance == engine.house_balance
+    assert state.house_profits == engine.house_profits
+    assert state.offset == os.path.getsize(path)
+
+
+def test_snapshot_past_end_of_log_is_ignored(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    engine = play(path, 6, commit_interval=0, snapshot_every=2)
+    with open(path, "r+b") as f:
+        f.truncate(0)
+    state = Ledger(str(path)).state
+    assert state.seq == 0
+    assert state.house_balance is None
+    assert engine.cycle_number == 7
+
+
+def test_group_commit_shares_one_fsync(tmp_path, monkeypatch):
+    fsyncs = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or real_fsync(fd))
+    path = tmp_path / "ledger.jsonl"
+    ledger = Ledger(str(path), commit_interval=5)
+    for n in range(1, 26):
+        ledger.append({"cycle": n, "house_balance": 10000, "house_profits": n})
+    ledger.close()
+
+    assert len(fsyncs) == 1
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["seq"] for r in records] == list(range(1, 26))
+
+
+def test_replay_reports_tampered_payout(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    play(path, 5)
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    records[2]["house_pool"] += 1
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+    report = replay(str(path))
+    assert report.cycles == 5
+    fields = {(cycle, field) for cycle, field, _, _ in report.mismatches}
+    assert (3, "house_pool") in fields
@@ -0,0 +1,57 @@
+from metrics import SPIN_WINDOW, GameMetrics, Registry
+
+
+def test_render_writes_help_type_and_samples():
+    registry = Registry()
+    registry.counter("cheza_cycles_total", "Cycles settled.").inc(3)
+    registry.gauge("cheza_house_balance_ksh", "House balance, in KSH.").set(10000.5)
+    assert registry.render() == (
+        "# HELP cheza_cycles_total Cycles settled.\n"
+        "# TYPE cheza_cycles_total counter\n"
+        "cheza_cycles_total 3\n"
+        "# HELP cheza_house_balance_ksh House balance, in KSH.\n"
+        "# TYPE cheza_house_balance_ksh gauge\n"
+        "cheza_house_balance_ksh 10000.5\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", (0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0, 3.0):
+        histogram.observe(value)
+    lines = registry.render().splitlines()[2:]
+    assert lines == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="0.5"} 3',
+        'latency_seconds_bucket{le="1.0"} 4',
+        'latency_seconds_bucket{le="+Inf"} 6',
+        "latency_seconds_sum 6.15",
+        "latency_seconds_count 6",
+    ]
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    gauge = registry.gauge("cheza_house_profits_ksh", "House profits, in KSH.")
+    gauge.watch({"table": 'back\\slash "quoted"\nline'}, lambda: 7)
+    gauge.watch({"table": "t1"}, lambda: 8)
+    samples = registry.render().splitlines()[2:]
+    assert samples == [
+        'cheza_house_profits_ksh{table="back\\\\slash \\"quoted\\"\\nline"} 7',
+        'cheza_house_profits_ksh{table="t1"} 8',
+    ]
+    gauge.unwatch({"table": "t1"})
+    assert len(registry.render().splitlines()) == 3
+
+
+def test_spins_per_minute_counts_the_last_window():
+    now = [1000.0]
+    metrics = GameMetrics(clock=lambda: now[0])
+    for _ in range(3):
+        metrics.spin()
+    now[0] += SPIN_WINDOW / 2
+    metrics.spin()
+    now[0] += SPIN_WINDOW / 2 + 1
+    assert metrics.spins_per_minute() == 1
+    assert "cheza_spins_total 4" in metrics.registry.render()
@@ -0,0 +1,59 @@
+import pytest
+
+from player_import import PlayerImportError, parse_text, validate_rows
+
+
+def test_csv_with_header_picks_named_columns():
+    text = "Stake (KSH),Player Name,Notes\n150,Ann,first\n300,Ben,\n"
+    assert parse_text(text) == [("Ann", "150"), ("Ben", "300")]
+
+
+def test_csv_without_header_reads_name_then_stake():
+    assert parse_text("Ann,150\n\nBen , 300 \n") == [("Ann", "150"), ("Ben", "300")]
+
+
+def test_tab_separated_text():
+    text = "name\tstake\nAnn\t150\nBen, Jr.\t300\n"
+    assert parse_text(text) == [("Ann", "150"), ("Ben, Jr.", "300")]
+
+
+def test_json_objects_pairs_and_players_key():
+    assert parse_text('[{"name": "Ann", "stake": 150}, ["Ben", "300"]]') == [
+        ("Ann", "150"), ("Ben", "300"),
+    ]
+    assert parse_text('{"players": [{"name": "Cy", "stake": 420.5}]}') == [("Cy", "420.5")]
+
+
+def test_invalid_json_is_an_import_error():
+    with pytest.raises(PlayerImportError, match="Invalid JSON"):
+        parse_text('[{"name": "Ann",')
+
+
+def test_validate_reports_every_bad_row_at_once():
+    rows = [("Ann", "150"), ("", "200"), ("Ben", "lots"), ("Cy", "50"), ("Di", "5000"),
+            ("Ed", "nan"), ("Fay", "999")]
+    with pytest.raises(PlayerImportError) as raised:
+        validate_rows(rows)
+    assert raised.value.errors == [
+        "Row 2: please enter name and stake.",
+        "Row 3 (Ben): invalid stake amount 'lots'.",
+        "Row 4 (Cy): stake must be at least KSH 100.",
+        "Row 5 (Di): stake cannot exceed KSH 999.",
+        "Row 6 (Ed): invalid stake amount 'nan'.",
+    ]
+
+
+def test_summary_caps_long_error_lists():
+    error = PlayerImportError([f"Row {n}: bad" for n in range(1, 21)])
+    lines = error.summary(limit=15).splitlines()
+    assert len(lines) == 16
+    assert lines[-1] == "...and 5 more problems."
+
+
+def test_valid_rows_build_a_player_table():
+    table = validate_rows(parse_text("Ann,150\nBen,300.5\n"))
+    assert table.names == ["Ann", "Ben"]
+    assert list(table.stakes) == [150.0, 300.5]
+    assert table.total_stake == 450.5
+    with pytest.raises(PlayerImportError, match="No players found"):
+        validate_rows([])
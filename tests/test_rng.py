@@ -0,0 +1,50 @@
+import json
+import random
+
+from engine import GameEngine, Player, WheelConfig
+from ledger import Ledger
+from replay import replay
+from rng import DRAW_LOG_ITEMS, TableRandom
+
+
+def test_stream_matches_plain_random_for_each_cycle():
+    rng = TableRandom(42)
+    rng.begin_cycle(3)
+    plain = random.Random("42:3")
+    drawn = [rng.randint(1, 50), rng.choice("abcdef"), rng.sample(range(100), 5), rng.random()]
+    assert drawn == [plain.randint(1, 50), plain.choice("abcdef"), plain.sample(range(100), 5),
+                     plain.random()]
+
+
+def test_large_results_are_logged_as_a_digest():
+    rng = TableRandom(1)
+    small = list(range(DRAW_LOG_ITEMS))
+    large = list(range(DRAW_LOG_ITEMS + 1))
+    rng.shuffle(small)
+    rng.shuffle(large)
+    assert rng.draws[0] == ["shuffle", small]
+    kind, logged = rng.draws[1]
+    assert kind == "shuffle"
+    assert logged["items"] == len(large) and len(logged["sha256"]) == 16
+
+
+def test_draw_log_can_be_turned_off():
+    logged, silent = TableRandom(9), TableRandom(9, log_draws=False)
+    for rng in (logged, silent):
+        rng.begin_cycle(1)
+    assert [logged.randint(1, 9) for _ in range(5)] == [silent.randint(1, 9) for _ in range(5)]
+    assert len(logged.draws) == 5 and silent.draws == []
+
+
+def test_large_wheel_ledger_stays_small_and_replays(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    ledger = Ledger(str(path))
+    engine = GameEngine(rng=TableRandom(5), wheel=WheelConfig(2000, 1, 20000), ledger=ledger)
+    for _ in range(3):
+        engine.run_cycle([Player("a", 100), Player("b", 200), Player("c", 300)])
+    ledger.close()
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert all(len(json.dumps(record["draws"])) < 500 for record in records)
+    report = replay(str(path))
+    assert report.cycles == 3 and report.ok, report.mismatches
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from client import RemoteEngine, TableClient
+from engine import WheelConfig
+from replay import replay
+from server import SESSION_SUFFIX, TableServer
+from snapshot import SessionStore
+
+
+def test_failed_seat_leaves_table_free(monkeypatch):
+    server = TableServer()
+    table = server.create_table("t")
+    engine = table.engine
+
+    def broken_start_cycle():
+        raise OverflowError("boom")
+
+    monkeypatch.setattr(engine, "start_cycle", broken_start_cycle)
+    with pytest.raises(OverflowError):
+        table.seat([["a", 100], ["b", 200]])
+    monkeypatch.undo()
+    assert not engine.players
+    assert engine.cycle_number == 1
+    assert table.seat([["a", 100], ["b", 200]])["phase"] == "picking"
+
+
+def test_seated_numbers_hide_the_cycle_winner():
+    server = TableServer()
+    table = server.create_table("t", WheelConfig(10, 1, 50).as_dict())
+    state = table.seat([["a", 100], ["b", 200], ["c", 300]])
+    assert [seat["number"] for seat in state["seated"]] == [None, None, None]
+    number = state["available"][0]
+    table.choose(number)
+    seated = table.state()["seated"]
+    assert seated[0]["number"] == number
+    assert [seat["number"] for seat in seated[1:]] == [None, None]
+
+
+@pytest.mark.parametrize("take_hidden", [False, True])
+def test_deltas_hide_the_cycle_winner(take_hidden):
+    server = TableServer()
+    for cycle in range(20):
+        table = server.create_table(f"t{cycle}", WheelConfig(10, 1, 50).as_dict())
+        engine = table.engine
+        state = table.seat([["a", 100], ["b", 200], ["c", 300]])
+        hidden = engine.cycle_winner.chosen_number
+        offered = set(state["available"])
+        assert offered == set(engine.wheel_numbers)
+        revealed = False  # the winner has picked, or someone took the number
+        while True:
+            winner_picking = engine.current_player is engine.cycle_winner
+            if take_hidden and not winner_picking and hidden in offered:
+                number = hidden
+            else:
+                number = min(offered - {hidden})
+            reply = table.choose(number)
+            assert number in reply["taken"]
+            if number != hidden:
+                assert hidden not in reply["taken"] + reply["freed"]
+            offered -= set(reply["taken"])
+            offered |= set(reply["freed"])
+            if "settlement" in reply:
+                break
+            assert set(table.state()["available"]) == offered
+            revealed = revealed or winner_picking or number == hidden
+            if not revealed:
+                assert hidden in offered
+
+
+def test_unexpected_errors_are_replied_not_dropped(monkeypatch):
+    server = TableServer()
+    table = server.create_table("t")
+
+    def failing_seat(players):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(table, "seat", failing_seat)
+
+    async def exchange():
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        replies = []
+        for request in ({"op": "seat", "table": "t", "players": [["a", 100]], "id": 1},
+                        {"op": "state", "table": "t", "id": 2}):
+            writer.write((json.dumps(request) + "\n").encode())
+            replies.append(json.loads(await reader.readline()))
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return replies
+
+    seat_reply, state_reply = asyncio.run(exchange())
+    assert seat_reply["ok"] is False and "disk full" in seat_reply["error"]
+    assert state_reply["ok"] is True and state_reply["id"] == 2
+
+
+def test_remote_engine_does_not_watch_its_table():
+    server = TableServer()
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    stopped = threading.Event()
+    ports = []
+
+    async def run():
+        listener = await server.start("127.0.0.1", 0)
+        ports.append(listener.sockets[0].getsockname()[1])
+        ready.set()
+        while not stopped.is_set():
+            await asyncio.sleep(0.01)
+        listener.close()
+        await listener.wait_closed()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(run(),))
+    thread.start()
+    ready.wait()
+    try:
+        address = f"127.0.0.1:{ports[0]}"
+        created = RemoteEngine(TableClient.connect(address))
+        joined = RemoteEngine(TableClient.connect(address), created.table)
+        assert joined.table == created.table
+        assert not server.tables[created.table].watchers
+        created.close()
+        joined.close()
+    finally:
+        stopped.set()
+        thread.join()
+        loop.close()
+
+
+def test_tables_share_one_disk_writer(tmp_path):
+    server = TableServer(str(tmp_path))
+    threads = threading.active_count()
+    for n in range(20):
+        table = server.create_table(f"t{n}")
+        for _ in range(2):
+            table.seat([["a", 100], ["b", 200]])
+            while "settlement" not in table.choose(table.state()["available"][0]):
+                pass
+    assert threading.active_count() <= threads + 1
+    server.close()
+    assert threading.active_count() <= threads
+    for n in range(20):
+        report = replay(str(tmp_path / f"t{n}.jsonl"))
+        assert report.cycles == 2 and report.ok, report.mismatches
+        assert SessionStore(str(tmp_path / f"t{n}{SESSION_SUFFIX}")).load().cycle_number == 2
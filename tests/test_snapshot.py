@@ -0,0 +1,157 @@
+import struct
+
+import pytest
+
+from engine import GameEngine, WheelConfig
+from player_import import validate_rows
+from rng import TableRandom
+from players import SpinHistory
+from snapshot import CHECKSUM, COUNT, HEADER, SessionSnapshot, SessionStore, SnapshotError
+
+PLAYERS = [("Ann", "150"), ("Bén", "300"), ("Chidi Ọ̀kàfọ̀", "420"), ("李雷", "999")]
+
+
+def first_available(engine, player):
+    return next(iter(engine.available))
+
+
+def played_engine(cycles=3, session=None, seed=11):
+    engine = GameEngine(
+        rng=TableRandom(seed), wheel=WheelConfig(12, 1, 80, house_number=7), session=session
+    )
+    for _ in range(cycles):
+        engine.run_cycle(validate_rows(PLAYERS), first_available)
+    return engine
+
+
+def settled_snapshot():
+    engine = played_engine(2)
+    engine.seat_players(validate_rows(PLAYERS))
+    engine.start_cycle()
+    engine.start_round()
+    while engine.current_player is not None:
+        engine.choose_number(first_available(engine, engine.current_player))
+    engine.pick_winning_number()
+    engine.resolve_spin()
+    engine.end_cycle()
+    return engine, SessionSnapshot.capture(engine)
+
+
+def test_round_trip_keeps_every_field():
+    engine, snapshot = settled_snapshot()
+    restored = SessionSnapshot.from_buffer(snapshot.to_bytes())
+
+    assert restored.house_balance == engine.house_balance
+    assert restored.house_profits == engine.house_profits
+    assert restored.cycle_number == engine.cycle_number == 3
+    assert restored.wheel.as_dict() == engine.wheel.as_dict()
+    assert restored.table_seed == 11
+    assert restored.rng_state == engine.rng.getstate()
+    assert restored.tracked_history == engine.tracked_history
+    assert len(engine.tracked_history) == 3
+
+    table = restored.players
+    assert table.names == [name for name, _ in PLAYERS]
+    for row, player in zip(table, engine.players):
+        assert row.stake == player.stake
+        assert row.payout == player.payout
+        assert row.wins == player.wins
+        assert row.rounds_played == player.rounds_played
+        assert row.chosen_number == player.chosen_number
+        assert row.spin_history == player.spin_history
+    assert restored.rows()[2] == ("Chidi Ọ̀kàfọ̀", "420")
+
+
+def test_restored_engine_plays_on_identically(tmp_path):
+    store = SessionStore(str(tmp_path / "session.bin"))
+    original = played_engine(3, session=store)
+    store.close()
+
+    resumed = GameEngine(rng=TableRandom(99), wheel=original.wheel, session=store)
+    assert resumed.restored is not None
+    assert resumed.cycle_number == original.cycle_number == 4
+    for engine in (original, resumed):
+        engine.session = None
+        engine.run_cycle(validate_rows(PLAYERS), first_available)
+    assert resumed.house_totals == original.house_totals
+    assert resumed.tracked_history == original.tracked_history
+
+
+def test_capture_is_not_changed_by_later_cycles():
+    engine, snapshot = settled_snapshot()
+    data = snapshot.to_bytes()
+    engine.next_cycle()
+    engine.run_cycle(validate_rows(PLAYERS), first_available)
+    assert snapshot.to_bytes() == data
+
+
+@pytest.mark.parametrize("offset", [0, HEADER.size + 3, -CHECKSUM.size - 1, -1])
+def test_damaged_bytes_are_rejected(offset):
+    data = bytearray(settled_snapshot()[1].to_bytes())
+    data[offset] ^= 0x40
+    with pytest.raises(SnapshotError):
+        SessionSnapshot.from_buffer(data)
+
+
+def test_truncated_and_foreign_files_are_rejected():
+    data = settled_snapshot()[1].to_bytes()
+    for cut in (0, 10, HEADER.size + CHECKSUM.size, len(data) - 1):
+        with pytest.raises(SnapshotError):
+            SessionSnapshot.from_buffer(data[:cut])
+    with pytest.raises(SnapshotError, match="version"):
+        SessionSnapshot.from_buffer(_resealed(data, 4, b"\x03\x00"))
+    with pytest.raises(SnapshotError, match="Not a session"):
+        SessionSnapshot.from_buffer(_resealed(data, 0, b"JUNK"))
+
+
+def test_untracked_histories_are_one_bitmap_per_spin():
+    engine, snapshot = settled_snapshot()
+    table = engine.players[0].table
+    assert list(table.histories) == [0]
+    assert len(table.spins) == 1
+    restored = SessionSnapshot.from_buffer(snapshot.to_bytes()).players
+    assert restored.spins == table.spins
+    assert [len(row.spin_history) for row in restored] == [3, 1, 1, 1]
+
+
+def test_version_1_snapshots_still_load():
+    engine, snapshot = settled_snapshot()
+    data = snapshot.to_bytes()
+    spins = engine.players[0].table.spins
+    body = data[:-CHECKSUM.size - COUNT.size - sum(len(bits) for bits in spins)]
+    # Version 1 ended with a history per player: indices, lengths, win counts, bits.
+    old = SpinHistory([True, False, True])
+    body += COUNT.pack(1) + struct.pack("<3q", 2, len(old), old.win_count) + bytes(old.bits)
+    restored = SessionSnapshot.from_buffer(_resealed(body + CHECKSUM.pack(0), 4, b"\x01\x00"))
+    assert restored.players[2].spin_history == [True, False, True]
+    assert restored.players[1].spin_history == []
+    assert restored.tracked_history == engine.tracked_history
+
+
+def _resealed(data, offset, patch):
+    import zlib
+
+    body = bytearray(data[:-CHECKSUM.size])
+    body[offset:offset + len(patch)] = patch
+    return bytes(body) + CHECKSUM.pack(zlib.crc32(body))
+
+
+def test_store_writes_latest_snapshot_in_background(tmp_path):
+    path = tmp_path / "session.bin"
+    store = SessionStore(str(path))
+    engine = played_engine(5, session=store)
+    store.close()
+    assert store.load().cycle_number == engine.cycle_number - 1
+    assert not (tmp_path / "session.bin.tmp").exists()
+
+
+def test_store_ignores_missing_and_damaged_files(tmp_path):
+    path = tmp_path / "session.bin"
+    store = SessionStore(str(path))
+    assert store.load() is None
+    path.write_bytes(b"")
+    assert store.load() is None
+    path.write_bytes(b"CHZS" + bytes(100))
+    assert store.load() is None
+    engine = GameEngine(session=store)
+    assert engine.restored is None and engine.cycle_number == 1
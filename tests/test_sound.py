@@ -0,0 +1,31 @@
+import sys
+from array import array
+
+from sound import RecordingSink, Sound, SoundPlayer
+
+
+def test_requests_reach_the_sink_in_order():
+    sink = RecordingSink()
+    player = SoundPlayer(sink)
+    player.play("spin")
+    player.play("missing")
+    player.play("win")
+    player.close()
+    assert sink.played == ["spin", "win"]
+    assert sink.format == (player.channels, player.rate)
+
+
+def test_mix_sums_and_clips_overlapping_sounds():
+    player = SoundPlayer(RecordingSink(), sounds={})
+    player.close()
+    player.sounds = {
+        "a": Sound("a", 1, 8000, array("h", [30000, -30000, 5, 7, 9]), b""),
+        "b": Sound("b", 1, 8000, array("h", [10000, -10000, 1]), b""),
+    }
+    voices = {"a": 0, "b": 0}
+    mixed = array("h")
+    mixed.frombytes(player.mix(voices, 4))
+    if sys.byteorder == "big":
+        mixed.byteswap()
+    assert list(mixed) == [32767, -32768, 6, 7]
+    assert voices == {"a": 4}
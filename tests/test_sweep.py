@@ -0,0 +1,25 @@
+import pytest
+
+from sweep import build_grid, run_house
+
+OPTIONS = {
+    "min_stake": [100],
+    "max_stake": [999],
+    "rounds_per_cycle": [1],
+    "payout_factor": [0.2],
+    "bonus_chance": [0.1],
+    "bonus_rate": [0.05],
+}
+
+
+@pytest.mark.parametrize("players", [0, 10])
+def test_grid_rejects_player_counts_the_wheel_cannot_seat(players):
+    with pytest.raises(ValueError, match="seats 1 to 9 players"):
+        build_grid({**OPTIONS, "players": [3, players]})
+
+
+def test_house_rejects_a_full_wheel():
+    point = {name: values[0] for name, values in OPTIONS.items()}
+    with pytest.raises(ValueError):
+        run_house({**point, "players": 10}, 5, 0)
+    assert len(run_house({**point, "players": 9}, 5, 0)) == 9
@@ -0,0 +1,87 @@
+from ui_queue import UpdateQueue
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append((ms, callback))
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for _, callback in callbacks:
+            callback()
+
+
+class FakeWidget:
+    def __init__(self):
+        self.calls = []
+
+    def config(self, **options):
+        self.calls.append(("config", options))
+
+    def insert(self, index, text):
+        self.calls.append(("insert", text))
+
+    def delete(self, start, end):
+        self.calls.append(("delete",))
+
+
+def test_set_keeps_only_the_latest_options_per_widget():
+    root = FakeRoot()
+    updates = UpdateQueue(root, interval_ms=16)
+    label = FakeWidget()
+    for n in range(5):
+        updates.set(label, text=f"cycle {n}")
+    updates.set(label, fg="red")
+    assert len(root.callbacks) == 1 and root.callbacks[0][0] == 16
+    assert label.calls == []
+    root.run()
+    assert label.calls == [("config", {"text": "cycle 4", "fg": "red"})]
+
+
+def test_writes_are_joined_into_one_insert_per_drain():
+    root = FakeRoot()
+    updates = UpdateQueue(root)
+    text = FakeWidget()
+    updates.write(text, "one\n")
+    updates.write(text, "two\n")
+    root.run()
+    assert text.calls == [
+        ("config", {"state": "normal"}),
+        ("insert", "one\ntwo\n"),
+        ("config", {"state": "disabled"}),
+    ]
+    updates.write(text, "three\n")
+    assert len(root.callbacks) == 1
+    root.run()
+    assert text.calls[-2] == ("insert", "three\n")
+
+
+def test_clear_drops_earlier_writes_and_keeps_later_ones():
+    root = FakeRoot()
+    updates = UpdateQueue(root)
+    text = FakeWidget()
+    updates.write(text, "stale\n")
+    updates.clear(text)
+    updates.write(text, "fresh\n")
+    root.run()
+    assert text.calls == [
+        ("config", {"state": "normal"}),
+        ("delete",),
+        ("insert", "fresh\n"),
+        ("config", {"state": "disabled"}),
+    ]
+
+
+def test_flush_applies_pending_updates_now():
+    root = FakeRoot()
+    updates = UpdateQueue(root)
+    label = FakeWidget()
+    updates.flush()
+    updates.set(label, text="now")
+    updates.flush()
+    assert label.calls == [("config", {"text": "now"})]
+    root.run()
+    assert label.calls == [("config", {"text": "now"})]
@@ -0,0 +1,13 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from vector_sim import simulate_exposure  # noqa: E402
+
+
+@pytest.mark.parametrize("payout_factor", [-0.5, 0.2, 1.0, 3.0])
+def test_profit_histogram_covers_every_cycle(payout_factor):
+    report = simulate_exposure(5000, paths=2, payout_factor=payout_factor, seed=3)
+    assert report.profit_histogram.sum() == report.total_cycles
+    percentiles = report.profit_percentiles()
+    assert report.profit_min - 1 <= percentiles["p1"] <= percentiles["p99"] <= report.profit_max
@@ -0,0 +1,55 @@
+UPDATE_INTERVAL_MS = 16  # drain at most once per ~60 Hz frame
+
+
+class UpdateQueue:
+    """Collects widget updates and applies them once per frame.
+
+    ``set`` keeps only the latest options per widget, so a label changed
+    five times in a frame is configured once; ``write`` joins every line
+    queued for a Text widget into a single insert between one
+    normal/disabled toggle.
+    """
+
+    def __init__(self, root, interval_ms=UPDATE_INTERVAL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.options = {}  # widget -> latest config options
+        self.texts = {}  # Text widget -> [cleared, chunks]
+        self.pending = False
+
+    def schedule(self):
+        if not self.pending:
+            self.pending = True
+            self.root.after(self.interval_ms, self.drain)
+
+    def set(self, widget, **options):
+        self.options.setdefault(widget, {}).update(options)
+        self.schedule()
+
+    def write(self, widget, text):
+        self.texts.setdefault(widget, [False, []])[1].append(text)
+        self.schedule()
+
+    def clear(self, widget):
+        # Anything queued before the clear would be deleted straight away.
+        self.texts[widget] = [True, []]
+        self.schedule()
+
+    def drain(self):
+        self.pending = False
+        options, self.options = self.options, {}
+        texts, self.texts = self.texts, {}
+        for widget, changes in options.items():
+            widget.config(**changes)
+        for widget, (cleared, chunks) in texts.items():
+            widget.config(state="normal")
+            if cleared:
+                widget.delete(1.0, "end")
+            if chunks:
+                widget.insert("end", "".join(chunks))
+            widget.config(state="disabled")
+
+    def flush(self):
+        """Apply everything queued now, e.g. before reading a widget back."""
+        if self.options or self.texts:
+            self.drain()
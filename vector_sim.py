@@ -0,0 +1,228 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from engine import (
+    BONUS_CHANCE,
+    BONUS_RATE,
+    MAXIMUM_STAKE,
+    MINIMUM_STAKE,
+    PAYOUT_FACTOR,
+    STARTING_BALANCE,
+)
+
+BLOCK_SIZE = 1 << 20  # cycles settled per NumPy pass
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+class ExposureReport:
+    def __init__(self, paths, cycles):
+        self.paths = paths
+        self.cycles = cycles  # per path
+        self.profit_histogram = None  # per-cycle house profit, 1 KSH bins
+        self.profit_offset = 0  # value of the first histogram bin
+        self.profit_sum = 0.0
+        self.profit_sq_sum = 0.0
+        self.profit_min = np.inf
+        self.profit_max = -np.inf
+        self.stake_pool = 0.0
+        self.bonus_cost = 0.0
+        self.bonuses_paid = 0
+        self.deficit_total = 0.0
+        self.deficit_cycles = 0
+        self.path_profits = np.zeros(paths)
+        self.final_balance = np.full(paths, float(STARTING_BALANCE))
+        self.ruin_cycle = np.full(paths, -1, dtype=np.int64)  # -1: never ruined
+        self.seconds = 0.0
+
+    @property
+    def total_cycles(self):
+        return self.paths * self.cycles
+
+    def profit_percentiles(self):
+        counts = np.cumsum(self.profit_histogram)
+        ranks = np.array(PERCENTILES) / 100 * counts[-1]
+        bins = np.searchsorted(counts, ranks)
+        return {f"p{q}": float(self.profit_offset + b) for q, b in zip(PERCENTILES, bins)}
+
+    def as_dict(self):
+        n = self.total_cycles
+        mean = self.profit_sum / n
+        ruined = self.ruin_cycle >= 0
+        report = {
+            "paths": self.paths,
+            "cycles_per_path": self.cycles,
+            "seconds": self.seconds,
+            "house_profit_per_cycle": {
+                "mean": mean,
+                "std": float(np.sqrt(max(self.profit_sq_sum / n - mean * mean, 0.0))),
+                "min": float(self.profit_min),
+                "max": float(self.profit_max),
+                **self.profit_percentiles(),
+            },
+            "house_profit_per_path": {
+                "mean": float(self.path_profits.mean()),
+                **{
+                    f"p{q}": float(v)
+                    for q, v in zip(PERCENTILES, np.percentile(self.path_profits, PERCENTILES))
+                },
+            },
+            "bonus_cost": {
+                "total": self.bonus_cost,
+                "per_cycle": self.bonus_cost / n,
+                "share_of_stakes": self.bonus_cost / self.stake_pool if self.stake_pool else 0.0,
+                "paid": self.bonuses_paid,
+            },
+            "deficits": {
+                "total": self.deficit_total,
+                "cycles": self.deficit_cycles,
+            },
+            "ruin": {
+                "probability": float(ruined.mean()),
+                "final_balance_min": float(self.final_balance.min()),
+            },
+        }
+        if ruined.any():
+            report["ruin"]["cycles_to_ruin"] = {
+                f"p{q}": float(v)
+                for q, v in zip(PERCENTILES, np.percentile(self.ruin_cycle[ruined] + 1, PERCENTILES))
+            }
+        return report
+
+
+def settle(rng, size, players, stakes, payout_factor, bonus_chance, bonus_rate):
+    """Settle ``size`` independent cycles.
+
+    Returns per-cycle arrays (pool, deficit, bonus, house_pool).
+    """
+    low_players, high_players = players
+    low_stake, high_stake = stakes
+    counts = rng.integers(low_players, high_players + 1, size)
+    winner_stake = rng.uniform(low_stake, high_stake, size)
+    # Sum of the other players' stakes: draw the widest table and mask.
+    others = rng.uniform(low_stake, high_stake, (size, max(high_players - 1, 1)))
+    others *= np.arange(others.shape[1]) < (counts - 1)[:, None]
+    pool = winner_stake + others.sum(axis=1)
+    # A lone player's repeat spin has no winner: the rules then settle
+    # against a nominal winning stake of 1.
+    winner_stake = np.where(counts == 1, 1.0, winner_stake)
+    payout = winner_stake + payout_factor * pool
+    deficit = np.maximum(payout - pool, 0.0)
+    remaining = np.maximum(pool - payout, 0.0)
+    bonus = np.where(rng.random(size) < bonus_chance, bonus_rate * remaining, 0.0)
+    return pool, deficit, bonus, remaining - bonus
+
+
+def simulate_exposure(cycles, paths=1, players=(2, 9), stakes=(MINIMUM_STAKE, MAXIMUM_STAKE),
+                      payout_factor=PAYOUT_FACTOR, bonus_chance=BONUS_CHANCE,
+                      bonus_rate=BONUS_RATE, starting_balance=STARTING_BALANCE,
+                      seed=None, block_size=BLOCK_SIZE):
+    """Simulate ``paths`` independent houses playing ``cycles`` cycles each.
+
+    Settles whole blocks of cycles per NumPy pass with the same rules as
+    ``GameEngine.end_cycle``. Each cycle seats a uniform random number of
+    players from the inclusive ``players`` range, with stakes drawn
+    uniformly from the ``stakes`` range. One of them is the cycle winner,
+    who gets back their stake plus ``payout_factor`` of the pool. A cycle
+    with a single player is settled as that player's losing repeat spin.
+    Two players picking the same number is not modelled.
+
+    As in the game, deficits come out of the house balance while house
+    pools go to profits, so ruin is the balance reaching zero.
+    """
+    if not 1 <= players[0] <= players[1]:
+        raise ValueError("players must be a (low, high) range starting at 1 or more")
+    if not 0 < stakes[0] <= stakes[1]:
+        raise ValueError("stakes must be a positive (low, high) range")
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    report = ExposureReport(paths, cycles)
+    report.final_balance[:] = starting_balance
+    max_pool = players[1] * stakes[1]
+    # A cycle loses at most winner + (payout_factor - 1) * pool <= payout_factor
+    # * pool, and keeps at most pool - winner - payout_factor * pool.
+    max_loss = int(np.ceil(max(payout_factor, 0) * max_pool))
+    max_gain = int(np.ceil(max(1 - payout_factor, 0) * max_pool))
+    report.profit_offset = -max_loss - 1
+    report.profit_histogram = np.zeros(max_loss + max_gain + 3, dtype=np.int64)
+    # Cycles are laid out path by path; each block settles whole rows of
+    # cycles from several paths, or a slice of one long path.
+    rows = max(1, block_size // cycles)
+    step = min(cycles, block_size)
+    for first_path in range(0, paths, rows):
+        block_paths = min(rows, paths - first_path)
+        balance = np.full(block_paths, float(starting_balance))
+        for first_cycle in range(0, cycles, step):
+            width = min(step, cycles - first_cycle)
+            pool, deficit, bonus, house_pool = settle(
+                rng, block_paths * width, players, stakes,
+                payout_factor, bonus_chance, bonus_rate,
+            )
+            profit = house_pool - deficit
+            report.profit_sum += float(profit.sum())
+            report.profit_sq_sum += float(np.dot(profit, profit))
+            report.profit_min = min(report.profit_min, float(profit.min()))
+            report.profit_max = max(report.profit_max, float(profit.max()))
+            # Clipping only guards against rounding at the extremes.
+            bins = np.clip(
+                (np.floor(profit) - report.profit_offset).astype(np.int64),
+                0, report.profit_histogram.size - 1,
+            )
+            report.profit_histogram += np.bincount(bins, minlength=report.profit_histogram.size)
+            report.stake_pool += float(pool.sum())
+            report.bonus_cost += float(bonus.sum())
+            report.bonuses_paid += int(np.count_nonzero(bonus))
+            report.deficit_total += float(deficit.sum())
+            report.deficit_cycles += int(np.count_nonzero(deficit))
+
+            rows_slice = slice(first_path, first_path + block_paths)
+            report.path_profits[rows_slice] += profit.reshape(block_paths, width).sum(axis=1)
+            path_balance = balance[:, None] - np.cumsum(deficit.reshape(block_paths, width), axis=1)
+            ruined = path_balance <= 0
+            first_ruin = np.where(ruined.any(axis=1), ruined.argmax(axis=1) + first_cycle, -1)
+            unset = report.ruin_cycle[rows_slice] < 0
+            report.ruin_cycle[rows_slice] = np.where(
+                unset, first_ruin, report.ruin_cycle[rows_slice]
+            )
+            balance = path_balance[:, -1]
+        report.final_balance[first_path:first_path + block_paths] = balance
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Vectorised house exposure simulation (needs NumPy)."
+    )
+    parser.add_argument("--cycles", type=int, default=1_000_000, help="cycles per path")
+    parser.add_argument("--paths", type=int, default=1)
+    parser.add_argument("--min-players", type=int, default=2)
+    parser.add_argument("--max-players", type=int, default=9)
+    parser.add_argument("--min-stake", type=float, default=MINIMUM_STAKE)
+    parser.add_argument("--max-stake", type=float, default=MAXIMUM_STAKE)
+    parser.add_argument("--payout-factor", type=float, default=PAYOUT_FACTOR)
+    parser.add_argument("--bonus-chance", type=float, default=BONUS_CHANCE)
+    parser.add_argument("--bonus-rate", type=float, default=BONUS_RATE)
+    parser.add_argument("--balance", type=float, default=STARTING_BALANCE)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    report = simulate_exposure(
+        args.cycles, args.paths,
+        players=(args.min_players, args.max_players),
+        stakes=(args.min_stake, args.max_stake),
+        payout_factor=args.payout_factor,
+        bonus_chance=args.bonus_chance,
+        bonus_rate=args.bonus_rate,
+        starting_balance=args.balance,
+        seed=args.seed,
+    )
+    json.dump(report.as_dict(), sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
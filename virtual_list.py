@@ -0,0 +1,62 @@
+import tkinter as tk
+
+VISIBLE_ROWS = 10
+
+
+class VirtualList(tk.Frame):
+    """Scrollable list that only has widgets for the rows on screen.
+
+    Subclasses build ``visible_rows`` rows of widgets, pass each widget to
+    ``bind_wheel`` and implement ``row_count`` and ``render_rows``; scrolling
+    rebinds the same widgets to the slice of data starting at ``first``.
+    """
+
+    def __init__(self, master, visible_rows=VISIBLE_ROWS):
+        super().__init__(master)
+        self.first = 0
+        self.visible_rows = visible_rows
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+
+    def place_scrollbar(self, row, column):
+        self.scrollbar.grid(row=row, column=column, rowspan=self.visible_rows, sticky="ns")
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+
+    def row_count(self):
+        raise NotImplementedError
+
+    def render_rows(self):
+        """Show rows ``first`` to ``first + visible_rows`` in the row widgets."""
+        raise NotImplementedError
+
+    def refresh(self):
+        self.render_rows()
+        total = self.row_count()
+        if total > self.visible_rows:
+            self.scrollbar.grid()
+            self.scrollbar.set(self.first / total, (self.first + self.visible_rows) / total)
+        else:
+            self.scrollbar.grid_remove()
+
+    def scroll_to(self, first):
+        first = max(0, min(first, self.row_count() - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.row_count()))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_to(self.first + int(args[1]) * step)
+
+    def on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
+        return "break"
@@ -0,0 +1,127 @@
+import math
+
+from engine import HOUSE_NUMBER
+
+LABEL_RADIUS = 0.7  # labels sit at 70% of the wheel radius
+MIN_LABEL_SPACING = 14  # pixels of arc per segment below which labels are skipped
+MIN_OUTLINE_SPACING = 4  # and below which segment outlines are dropped
+ANGLE_STEPS = 4  # angle table resolution, entries per degree
+
+
+class WheelRenderer:
+    """Draws the wheel once and then only moves the existing canvas items.
+
+    Works with any object that has the tkinter Canvas item API
+    (create_arc, create_text, create_polygon, itemconfigure, coords).
+    """
+
+    def __init__(self, canvas, num_segments, colors, center_x, center_y, radius,
+                 house_number=HOUSE_NUMBER):
+        self.canvas = canvas
+        self.num_segments = num_segments
+        self.colors = colors
+        self.center_x = center_x
+        self.center_y = center_y
+        self.radius = radius
+        self.house_number = house_number
+        self.angle_per_segment = 360 / num_segments
+        # Level of detail: on big wheels the labels would overlap into an
+        # unreadable blur, so they are not drawn (or moved) at all.
+        segment_pixels = math.radians(self.angle_per_segment) * LABEL_RADIUS * radius
+        self.show_labels = segment_pixels >= MIN_LABEL_SPACING
+        self.outline = "black" if segment_pixels >= MIN_OUTLINE_SPACING else ""
+        self.arcs = []
+        self.labels = []
+        self.pointer = None
+        self.label_state = [None] * num_segments
+        self.angle = None
+        self.on_click = None  # called with the segment index of a clicked segment
+        self.table_size = 360 * ANGLE_STEPS
+        label_radius = LABEL_RADIUS * radius
+        self.label_positions = [
+            (
+                center_x + label_radius * math.cos(math.radians(step / ANGLE_STEPS)),
+                center_y - label_radius * math.sin(math.radians(step / ANGLE_STEPS)),
+            )
+            for step in range(self.table_size)
+        ]
+
+    def build(self):
+        if self.arcs:
+            return
+        bbox = (
+            self.center_x - self.radius,
+            self.center_y - self.radius,
+            self.center_x + self.radius,
+            self.center_y + self.radius,
+        )
+        for i in range(self.num_segments):
+            self.arcs.append(self.canvas.create_arc(
+                *bbox,
+                start=i * self.angle_per_segment,
+                extent=self.angle_per_segment - 0.1 if self.outline else self.angle_per_segment,
+                fill=self.colors[i % len(self.colors)],
+                outline=self.outline,
+            ))
+            self.canvas.tag_bind(self.arcs[i], "<Button-1>", lambda event, i=i: self.clicked(i))
+            if not self.show_labels:
+                continue
+            self.labels.append(self.canvas.create_text(
+                *self.label_position(i * self.angle_per_segment + self.angle_per_segment / 2),
+                text="",
+                font=("Arial", 12, "normal"),
+                fill="white",
+            ))
+            self.canvas.tag_bind(self.labels[i], "<Button-1>", lambda event, i=i: self.clicked(i))
+        self.pointer = self.canvas.create_polygon(
+            self.center_x - 10, self.center_y + self.radius + 10,
+            self.center_x + 10, self.center_y + self.radius + 10,
+            self.center_x, self.center_y + self.radius,
+            fill="black",
+        )
+        self.angle = 0
+
+    def label_position(self, angle):
+        return self.label_positions[int(round(angle * ANGLE_STEPS)) % self.table_size]
+
+    def clicked(self, segment):
+        if self.on_click is not None:
+            self.on_click(segment)
+
+    def update_labels(self, numbers, chosen_numbers=()):
+        self.build()
+        if not self.show_labels:
+            return
+        for i in range(self.num_segments):
+            number = numbers[i] if numbers else ""
+            self.set_label(i, number, number in chosen_numbers)
+
+    def set_label(self, segment, number, chosen=False):
+        """Restyle one segment's label; a no-op if it already looks right."""
+        if not self.show_labels:
+            return
+        if number == self.house_number:
+            font_style = "italic"
+        elif chosen:
+            font_style = "bold"
+        else:
+            font_style = "normal"
+        state = (number, font_style)
+        if self.label_state[segment] != state:
+            self.label_state[segment] = state
+            self.canvas.itemconfigure(
+                self.labels[segment], text=str(number), font=("Arial", 12, font_style)
+            )
+
+    def rotate(self, start_angle):
+        self.build()
+        if start_angle == self.angle:
+            return
+        self.angle = start_angle
+        step = self.angle_per_segment
+        half = step / 2
+        for i in range(self.num_segments):
+            arc_start = start_angle + i * step
+            self.canvas.itemconfigure(self.arcs[i], start=arc_start)
+            if self.show_labels:
+                self.canvas.coords(self.labels[i], *self.label_position(arc_start + half))